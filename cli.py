@@ -21,13 +21,76 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import sys
+from contextlib import AsyncExitStack
 from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
 
-from src.composio_mcp.notion import NotionClient
-from src.composio_mcp.zoom import ZoomClient
-from src.composio_mcp.models.zoom import MeetingCreate
+# Client libraries (httpx, pydantic models) are imported where first used,
+# so --help and argument errors don't pay for them.
+if TYPE_CHECKING:
+    import httpx
+
+    from src.composio_mcp.notion import NotionClient
+    from src.composio_mcp.zoom import ZoomClient
+
+
+# ==================================================================
+# SHARED CLIENTS
+# ==================================================================
+
+# Clients are created lazily on first use inside _run() and share a single
+# HTTP connection pool; the exit stack closes everything when _run() returns.
+_stack: Optional[AsyncExitStack] = None
+_http: Optional["httpx.AsyncClient"] = None
+_notion: Optional["NotionClient"] = None
+_zoom: Optional["ZoomClient"] = None
+
+
+async def _get_http() -> "httpx.AsyncClient":
+    global _http
+    if _http is None:
+        from src.composio_mcp.client import create_http_client
+        _http = await _stack.enter_async_context(create_http_client())
+    return _http
+
+
+async def get_notion() -> "NotionClient":
+    global _notion
+    if _notion is None:
+        from src.composio_mcp.notion import NotionClient
+        _notion = await _stack.enter_async_context(
+            NotionClient.from_env(http_client=await _get_http())
+        )
+    return _notion
+
+
+async def get_zoom() -> "ZoomClient":
+    global _zoom
+    if _zoom is None:
+        from src.composio_mcp.zoom import ZoomClient
+        _zoom = await _stack.enter_async_context(
+            ZoomClient.from_env(http_client=await _get_http())
+        )
+    return _zoom
+
+
+async def _run(command, args):
+    """Run a command coroutine with shared clients kept alive for its duration."""
+    global _stack, _http, _notion, _zoom
+    async with AsyncExitStack() as stack:
+        _stack = stack
+        try:
+            await command(args)
+        finally:
+            _stack = _http = _notion = _zoom = None
+
+
+def _write_lines(lines: list[str], chunk: int = 256) -> None:
+    """Print lines with one stdout write per chunk instead of one per line."""
+    for i in range(0, len(lines), chunk):
+        sys.stdout.write("\n".join(lines[i:i + chunk]) + "\n")
 
 
 # ==================================================================
@@ -36,46 +99,50 @@ from src.composio_mcp.models.zoom import MeetingCreate
 
 
 async def notion_me(args):
-    async with NotionClient.from_env() as client:
-        user = await client.get_current_user()
+    client = await get_notion()
+    user = await client.get_current_user()
     print(f"Bot: {user.name or 'Unknown'} ({user.id})")
     if user.type:
         print(f"  Type: {user.type}")
 
 
 async def notion_users(args):
-    async with NotionClient.from_env() as client:
-        users = await client.list_users()
+    client = await get_notion()
+    users = await client.list_users()
     if not users:
         print("No users found.")
         return
+    lines = []
     for u in users:
         email = f" ({u.email})" if u.email else ""
-        print(f"  {u.name or 'Unknown'}{email} [{u.type or '?'}] - {u.id}")
+        lines.append(f"  {u.name or 'Unknown'}{email} [{u.type or '?'}] - {u.id}")
+    _write_lines(lines)
 
 
 async def notion_search(args):
-    async with NotionClient.from_env() as client:
-        results = await client.search_workspace(
-            query=args.query,
-            filter_type=args.type,
-            page_size=args.limit,
-        )
+    client = await get_notion()
+    results = await client.search_workspace(
+        query=args.query,
+        filter_type=args.type,
+        page_size=args.limit,
+    )
     if not results:
         print("No results found.")
         return
+    lines = []
     for r in results:
         icon = "p" if r.object_type == "page" else "db"
-        print(f"  [{icon}] {r.title or 'Untitled'}")
-        print(f"       ID: {r.id}")
+        lines.append(f"  [{icon}] {r.title or 'Untitled'}")
+        lines.append(f"       ID: {r.id}")
         if r.url:
-            print(f"       URL: {r.url}")
-        print()
+            lines.append(f"       URL: {r.url}")
+        lines.append("")
+    _write_lines(lines)
 
 
 async def notion_page(args):
-    async with NotionClient.from_env() as client:
-        page = await client.get_page(args.page_id)
+    client = await get_notion()
+    page = await client.get_page(args.page_id)
     print(f"Page: {page.title or 'Untitled'}")
     print(f"  ID: {page.id}")
     if page.url:
@@ -88,12 +155,12 @@ async def notion_page(args):
 
 
 async def notion_create_page(args):
-    async with NotionClient.from_env() as client:
-        page = await client.create_page(
-            parent_id=args.parent_id,
-            title=args.title,
-            icon=args.icon,
-        )
+    client = await get_notion()
+    page = await client.create_page(
+        parent_id=args.parent_id,
+        title=args.title,
+        icon=args.icon,
+    )
     print(f"Page created: {page.title}")
     print(f"  ID: {page.id}")
     if page.url:
@@ -101,8 +168,8 @@ async def notion_create_page(args):
 
 
 async def notion_database(args):
-    async with NotionClient.from_env() as client:
-        db = await client.get_database(args.database_id)
+    client = await get_notion()
+    db = await client.get_database(args.database_id)
     print(f"Database: {db.title or 'Untitled'}")
     print(f"  ID: {db.id}")
     if db.url:
@@ -114,17 +181,19 @@ async def notion_database(args):
 
 
 async def notion_query(args):
-    filter_obj = json.loads(args.filter) if args.filter else None
-    async with NotionClient.from_env() as client:
-        rows = await client.query_database(
-            database_id=args.database_id,
-            filter=filter_obj,
-            page_size=args.page_size,
-        )
+    from src.composio_mcp import _json
+
+    filter_obj = _json.loads(args.filter) if args.filter else None
+    client = await get_notion()
+    rows = await client.query_database(
+        database_id=args.database_id,
+        filter=filter_obj,
+        page_size=args.page_size,
+    )
     if not rows:
         print("No rows found.")
         return
-    print(f"Found {len(rows)} rows:")
+    lines = [f"Found {len(rows)} rows:"]
     for row in rows:
         title = None
         for prop in row.properties.values():
@@ -133,7 +202,8 @@ async def notion_query(args):
                 if title_arr and isinstance(title_arr, list):
                     title = "".join(t.get("plain_text", "") for t in title_arr)
                 break
-        print(f"  - {title or 'Untitled'} ({row.id})")
+        lines.append(f"  - {title or 'Untitled'} ({row.id})")
+    _write_lines(lines)
 
 
 # ==================================================================
@@ -141,85 +211,102 @@ async def notion_query(args):
 # ==================================================================
 
 
+@lru_cache(maxsize=4096)
+def _format_time(value: Union[str, datetime], fmt: str) -> str:
+    """Format an ISO string or datetime; listings repeat the same timestamps."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value.strftime(fmt)
+
+
+_MEETING_TEMPLATE = (
+    "  Topic:      {topic}\n"
+    "  Date/Time:  {when} {timezone}\n"
+    "  Duration:   {duration} min\n"
+    "  Meeting ID: {id}"
+    "{password}{join_url}"
+)
+
+
 def format_meeting(m) -> str:
-    dt = m.start_time
-    if isinstance(dt, str):
-        dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-    formatted = dt.strftime("%a, %b %d %Y at %I:%M %p")
-    lines = [
-        f"  Topic:      {m.topic}",
-        f"  Date/Time:  {formatted} {m.timezone}",
-        f"  Duration:   {m.duration} min",
-        f"  Meeting ID: {m.id}",
-    ]
-    if m.password:
-        lines.append(f"  Password:   {m.password}")
-    if m.join_url:
-        lines.append(f"  Join URL:   {m.join_url}")
-    return "\n".join(lines)
+    return _MEETING_TEMPLATE.format_map({
+        "topic": m.topic,
+        "when": _format_time(m.start_time, "%a, %b %d %Y at %I:%M %p"),
+        "timezone": m.timezone,
+        "duration": m.duration,
+        "id": m.id,
+        "password": f"\n  Password:   {m.password}" if m.password else "",
+        "join_url": f"\n  Join URL:   {m.join_url}" if m.join_url else "",
+    })
 
 
 async def zoom_list(args):
-    async with ZoomClient.from_env() as client:
-        meetings = await client.list_meetings(args.type)
+    client = await get_zoom()
+    meetings = await client.list_meetings(args.type)
     if not meetings:
         print("No meetings found.")
         return
+    lines = []
     for m in meetings:
-        print(format_meeting(m))
-        print()
+        lines.append(format_meeting(m))
+        lines.append("")
+    _write_lines(lines)
 
 
 async def zoom_create(args):
-    async with ZoomClient.from_env() as client:
-        meeting = await client.create_meeting(MeetingCreate(
-            topic=args.topic,
-            start_time=args.datetime,
-            duration=args.duration,
-            timezone=args.timezone,
-            agenda=args.agenda,
-        ))
+    from src.composio_mcp.models.zoom import MeetingCreate
+
+    client = await get_zoom()
+    meeting = await client.create_meeting(MeetingCreate(
+        topic=args.topic,
+        start_time=args.datetime,
+        duration=args.duration,
+        timezone=args.timezone,
+        agenda=args.agenda,
+    ))
     print("Meeting created:\n")
     print(format_meeting(meeting))
 
 
 async def zoom_get(args):
-    async with ZoomClient.from_env() as client:
-        meeting = await client.get_meeting(args.meeting_id)
+    client = await get_zoom()
+    meeting = await client.get_meeting(args.meeting_id)
     print(format_meeting(meeting))
 
 
 async def zoom_update(args):
-    async with ZoomClient.from_env() as client:
-        await client.update_meeting(
-            args.meeting_id,
-            topic=args.topic,
-            start_time=args.datetime,
-            duration=args.duration,
-            agenda=args.agenda,
-        )
+    client = await get_zoom()
+    await client.update_meeting(
+        args.meeting_id,
+        topic=args.topic,
+        start_time=args.datetime,
+        duration=args.duration,
+        agenda=args.agenda,
+    )
     print(f"Meeting {args.meeting_id} updated.")
 
 
 async def zoom_recordings(args):
-    async with ZoomClient.from_env() as client:
-        recordings = await client.list_recordings(args.from_date, args.to_date)
-    if not recordings:
+    client = await get_zoom()
+    found = False
+    # Print each date window as it lands while later windows are fetched
+    async for page in client.iter_recording_pages(args.from_date, args.to_date):
+        lines = []
+        for r in page:
+            lines.append(f"  {r.topic}")
+            lines.append(f"    Date: {_format_time(r.start_time, '%b %d, %Y')}, Duration: {r.duration} min")
+            lines.append(f"    Meeting ID: {r.meeting_id}")
+            lines.append("")
+        if lines:
+            found = True
+            _write_lines(lines)
+    if not found:
         print("No recordings found.")
-        return
-    for r in recordings:
-        dt = r.start_time
-        if isinstance(dt, str):
-            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-        print(f"  {r.topic}")
-        print(f"    Date: {dt.strftime('%b %d, %Y')}, Duration: {r.duration} min")
-        print(f"    Meeting ID: {r.meeting_id}")
-        print()
 
 
 async def zoom_recording(args):
-    async with ZoomClient.from_env() as client:
-        recording = await client.get_recording(args.meeting_id)
+    client = await get_zoom()
+    recording = await client.get_recording(args.meeting_id)
     print(f"Recording: {recording.topic}")
     print(f"  Share URL: {recording.share_url}")
     if recording.password:
@@ -232,8 +319,8 @@ async def zoom_recording(args):
 
 
 async def zoom_participants(args):
-    async with ZoomClient.from_env() as client:
-        participants = await client.get_participants(args.meeting_id)
+    client = await get_zoom()
+    participants = await client.get_participants(args.meeting_id)
     if not participants:
         print("No participants found.")
         return
@@ -244,8 +331,8 @@ async def zoom_participants(args):
 
 
 async def zoom_summary(args):
-    async with ZoomClient.from_env() as client:
-        summary = await client.get_meeting_summary(args.meeting_id)
+    client = await get_zoom()
+    summary = await client.get_meeting_summary(args.meeting_id)
     if summary.summary:
         print("Summary:")
         print(f"  {summary.summary}")
@@ -264,47 +351,45 @@ async def zoom_summary(args):
 # ==================================================================
 
 
-def build_parser():
-    parser = argparse.ArgumentParser(description="Composio CLI")
-    subparsers = parser.add_subparsers(dest="domain", required=True)
-
-    # --- Notion subcommands ---
-    notion_p = subparsers.add_parser("notion", help="Notion operations")
-    notion_sub = notion_p.add_subparsers(dest="command", required=True)
-
-    notion_sub.add_parser("me", help="Get current bot user")
-    notion_sub.add_parser("users", help="List workspace users")
+def _add_notion_commands(notion_sub):
+    notion_sub.add_parser("me", help="Get current bot user").set_defaults(func=notion_me)
+    notion_sub.add_parser("users", help="List workspace users").set_defaults(func=notion_users)
 
     search_p = notion_sub.add_parser("search", help="Search workspace")
+    search_p.set_defaults(func=notion_search)
     search_p.add_argument("query", nargs="?", default="")
     search_p.add_argument("--type", "-t", choices=["page", "database"])
     search_p.add_argument("--limit", "-l", type=int, default=20)
 
     page_p = notion_sub.add_parser("page", help="Get page details")
+    page_p.set_defaults(func=notion_page)
     page_p.add_argument("page_id")
 
     create_p = notion_sub.add_parser("create-page", help="Create a page")
+    create_p.set_defaults(func=notion_create_page)
     create_p.add_argument("parent_id")
     create_p.add_argument("title")
     create_p.add_argument("--icon", "-i")
 
     db_p = notion_sub.add_parser("database", help="Get database details")
+    db_p.set_defaults(func=notion_database)
     db_p.add_argument("database_id")
 
     query_p = notion_sub.add_parser("query", help="Query a database")
+    query_p.set_defaults(func=notion_query)
     query_p.add_argument("database_id")
     query_p.add_argument("--filter", "-f")
     query_p.add_argument("--page-size", "-n", type=int, default=20)
 
-    # --- Zoom subcommands ---
-    zoom_p = subparsers.add_parser("zoom", help="Zoom operations")
-    zoom_sub = zoom_p.add_subparsers(dest="command", required=True)
 
+def _add_zoom_commands(zoom_sub):
     list_p = zoom_sub.add_parser("list", help="List meetings")
+    list_p.set_defaults(func=zoom_list)
     list_p.add_argument("--type", "-t", default="upcoming",
                         choices=["upcoming", "scheduled", "live", "pending"])
 
     zcreate_p = zoom_sub.add_parser("create", help="Create meeting")
+    zcreate_p.set_defaults(func=zoom_create)
     zcreate_p.add_argument("--topic", "-t", required=True)
     zcreate_p.add_argument("--datetime", "-d", required=True)
     zcreate_p.add_argument("--duration", "-l", type=int, default=45)
@@ -312,9 +397,11 @@ def build_parser():
     zcreate_p.add_argument("--agenda", "-a")
 
     get_p = zoom_sub.add_parser("get", help="Get meeting")
+    get_p.set_defaults(func=zoom_get)
     get_p.add_argument("meeting_id", type=int)
 
     update_p = zoom_sub.add_parser("update", help="Update meeting")
+    update_p.set_defaults(func=zoom_update)
     update_p.add_argument("meeting_id", type=int)
     update_p.add_argument("--topic", "-t")
     update_p.add_argument("--datetime", "-d")
@@ -322,50 +409,64 @@ def build_parser():
     update_p.add_argument("--agenda", "-a")
 
     rec_p = zoom_sub.add_parser("recordings", help="List recordings")
+    rec_p.set_defaults(func=zoom_recordings)
     rec_p.add_argument("--from", dest="from_date", required=True)
     rec_p.add_argument("--to", dest="to_date")
 
     rec_get_p = zoom_sub.add_parser("recording", help="Get recording")
+    rec_get_p.set_defaults(func=zoom_recording)
     rec_get_p.add_argument("meeting_id", type=int)
 
     part_p = zoom_sub.add_parser("participants", help="Get participants")
+    part_p.set_defaults(func=zoom_participants)
     part_p.add_argument("meeting_id", type=int)
 
     sum_p = zoom_sub.add_parser("summary", help="Get meeting summary")
+    sum_p.set_defaults(func=zoom_summary)
     sum_p.add_argument("meeting_id", type=int)
 
+
+_DOMAINS = {
+    "notion": ("Notion operations", _add_notion_commands),
+    "zoom": ("Zoom operations", _add_zoom_commands),
+}
+
+
+def build_parser(domains=None):
+    """Build the CLI parser.
+
+    Args:
+        domains: Domains whose subcommands to build (default: all). Every
+            domain is still registered, so help and choices are complete;
+            main() only pays for the subcommand tree it is about to use.
+    """
+    parser = argparse.ArgumentParser(description="Composio CLI")
+    subparsers = parser.add_subparsers(dest="domain", required=True)
+
+    for name, (help_text, add_commands) in _DOMAINS.items():
+        domain_p = subparsers.add_parser(name, help=help_text)
+        if domains is None or name in domains:
+            add_commands(domain_p.add_subparsers(dest="command", required=True))
+
     return parser
 
 
-COMMANDS = {
-    "notion": {
-        "me": notion_me,
-        "users": notion_users,
-        "search": notion_search,
-        "page": notion_page,
-        "create-page": notion_create_page,
-        "database": notion_database,
-        "query": notion_query,
-    },
-    "zoom": {
-        "list": zoom_list,
-        "create": zoom_create,
-        "get": zoom_get,
-        "update": zoom_update,
-        "recordings": zoom_recordings,
-        "recording": zoom_recording,
-        "participants": zoom_participants,
-        "summary": zoom_summary,
-    },
-}
+def _asyncio_run(coro):
+    """Run coro on uvloop when it is installed ('fast' extra), else asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
 
 def main():
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    parser = build_parser(argv[:1])
+    args = parser.parse_args(argv)
 
     try:
-        asyncio.run(COMMANDS[args.domain][args.command](args))
+        _asyncio_run(_run(args.func, args))
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -3,51 +3,231 @@
 
 Unified server providing:
 - Management tools (auth configs, connections, toolkits, execute)
-- Notion tools (28 tools, prefixed notion_*)
-- Zoom tools (9 tools, prefixed zoom_*)
+- Notion tools (35 tools, prefixed notion_*)
+- Zoom tools (11 tools, prefixed zoom_*)
 """
 
-import json
-from typing import Optional
+import os
+import uuid
+import weakref
+from collections import OrderedDict
+from contextlib import aclosing, asynccontextmanager
+from functools import cached_property
+from typing import Any, AsyncIterator, Optional, TypeVar
 
-from mcp.server.fastmcp import FastMCP
+import anyio
+import httpx
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import BaseModel, TypeAdapter
 
 from src.composio_mcp import ComposioClient
+from src.composio_mcp import _json
+from src.composio_mcp.client import create_http_client
+from src.composio_mcp.models import (
+    Block,
+    Comment,
+    DatabaseRow,
+    Meeting,
+    Page,
+    Participant,
+    Recording,
+    SearchResult,
+    Toolkit,
+    ToolkitTool,
+    User,
+)
 from src.composio_mcp.notion import NotionClient
 from src.composio_mcp.zoom import ZoomClient
 from src.composio_mcp.models.zoom import MeetingCreate
 
-mcp = FastMCP("composio")
+class _Clients:
+    """Lazily built clients, all sharing one HTTP connection pool.
 
-# Lazy-loaded clients
-_client: Optional[ComposioClient] = None
-_notion: Optional[NotionClient] = None
-_zoom: Optional[ZoomClient] = None
+    Each client is a cached_property: the first access builds it and stores
+    it on the instance, after which tools read it as a plain attribute with
+    no getter call or None check.
+    """
+
+    @cached_property
+    def http(self) -> httpx.AsyncClient:
+        # Agents fan out many concurrent tool calls; size the pool so they
+        # don't queue behind each other and keep idle connections warm.
+        return create_http_client(
+            max_connections=int(os.environ.get("COMPOSIO_HTTP_MAX_CONNECTIONS", "200")),
+            keepalive_expiry=75.0,
+        )
+
+    @cached_property
+    def composio(self) -> ComposioClient:
+        return ComposioClient.from_env(http_client=self.http)
+
+    @cached_property
+    def notion(self) -> NotionClient:
+        return NotionClient.from_env(http_client=self.http)
+
+    @cached_property
+    def zoom(self) -> ZoomClient:
+        return ZoomClient.from_env(http_client=self.http)
+
+    @cached_property
+    def queries(self) -> OrderedDict[str, tuple[Optional[str], str, Optional[dict], Optional[list]]]:
+        # Open notion_open_query handles: (owner, database_id, filter, sorts)
+        return OrderedDict()
+
+    @cached_property
+    def query_owners(self) -> "weakref.WeakKeyDictionary[Any, str]":
+        # Owner token of each live MCP session that has opened a query
+        return weakref.WeakKeyDictionary()
+
+    def prebuild(self) -> None:
+        """Construct every client whose credentials are available."""
+        for name in ("composio", "notion", "zoom"):
+            try:
+                getattr(self, name)
+            except ValueError:
+                # Missing credentials; that domain's tools report it on use
+                pass
+
+    async def aclose(self) -> None:
+        """Close the shared pool and drop every cached client."""
+        http = self.__dict__.get("http")
+        self.__dict__.clear()
+        if http is not None:
+            await http.aclose()
+
+
+clients = _Clients()
+
+
+async def _warmup() -> None:
+    """Open a keep-alive connection to the Composio backend.
+
+    Notion and Zoom actions are proxied through the same host, so one
+    connection covers every tool; the first call then skips DNS+TCP+TLS.
+    """
+    try:
+        await clients.http.head(ComposioClient.BASE_URL)
+    except httpx.HTTPError:
+        # Best effort; a real tool call will surface connectivity errors
+        pass
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Build clients and warm the connection pool on startup; close on shutdown."""
+    try:
+        # Credential lookup may call Secrets Manager (blocking boto3); pay it
+        # once here rather than inside the first tool call
+        await anyio.to_thread.run_sync(clients.prebuild)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_warmup)
+            yield
+            tg.cancel_scope.cancel()
+    finally:
+        await clients.aclose()
+
+
+class _FastMCP(FastMCP):
+    """FastMCP that builds its tools/list response once.
+
+    Every tool is registered at import, but FastMCP rebuilds the MCP tool
+    models on each listing; reuse them until the tool set changes.
+    """
+
+    _tool_list: Optional[list] = None
+
+    async def list_tools(self):
+        if self._tool_list is None:
+            self._tool_list = await super().list_tools()
+        return self._tool_list
 
+    def add_tool(self, *args, **kwargs) -> None:
+        self._tool_list = None
+        super().add_tool(*args, **kwargs)
 
-def get_client() -> ComposioClient:
-    global _client
-    if _client is None:
-        _client = ComposioClient.from_env()
-    return _client
+    def remove_tool(self, name: str) -> None:
+        self._tool_list = None
+        super().remove_tool(name)
 
 
-def get_notion() -> NotionClient:
-    global _notion
-    if _notion is None:
-        _notion = NotionClient.from_env()
-    return _notion
+mcp = _FastMCP("composio", lifespan=lifespan)
 
+# Responses are compact JSON: tool output is read by models, and indentation
+# only adds bytes and tokens. Set COMPOSIO_COMPACT_JSON=0 to pretty-print.
+_INDENT: Optional[int] = 2 if os.environ.get("COMPOSIO_COMPACT_JSON") == "0" else None
 
-def get_zoom() -> ZoomClient:
-    global _zoom
-    if _zoom is None:
-        _zoom = ZoomClient.from_env()
-    return _zoom
+
+def _dumps(obj, indent: Optional[int] = _INDENT) -> str:
+    """Serialize a tool result (orjson when available)."""
+    return _json.dumps(obj, indent=indent)
+
+
+async def _dumps_stream(items: AsyncIterator[BaseModel]) -> str:
+    """Serialize models into a JSON array as they arrive from a paged listing.
+
+    Each model is encoded as soon as its page lands, so only one page of
+    models is alive at a time. Output matches _dumps() of the same list.
+    """
+    parts = []
+    if _INDENT is None:
+        async for item in items:
+            parts.append(item.model_dump_json())
+        return "[" + ",".join(parts) + "]"
+    async for item in items:
+        parts.append("  " + item.model_dump_json(indent=_INDENT).replace("\n", "\n  "))
+    if not parts:
+        return "[]"
+    return "[\n" + ",\n".join(parts) + "\n]"
+
+
+T = TypeVar("T")
+
+
+def _page_size_for(limit: Optional[int]) -> int:
+    """Notion page size for fetching at most limit results."""
+    return min(limit, 100) if limit else 100
+
+
+async def _take(items: AsyncIterator[T], limit: Optional[int]) -> AsyncIterator[T]:
+    """Yield at most limit items (all if None), then stop fetching pages."""
+    async with aclosing(items):
+        if limit is None:
+            async for item in items:
+                yield item
+            return
+        if limit <= 0:
+            return
+        count = 0
+        async for item in items:
+            yield item
+            count += 1
+            if count >= limit:
+                return
+
+
+# Structured JSON arguments are parsed and shape-checked in one pass by
+# pydantic-core, so e.g. a filter that isn't an object fails before any
+# request is made.
+_JSON_OBJECT_ADAPTER = TypeAdapter(dict[str, Any])
+_JSON_OBJECT_LIST_ADAPTER = TypeAdapter(list[dict[str, Any]])
+
+# List serializers built once; dump_json encodes models in a single pass
+# without building intermediate dicts.
+_TOOLKIT_LIST_ADAPTER = TypeAdapter(list[Toolkit])
+_TOOLKIT_TOOL_LIST_ADAPTER = TypeAdapter(list[ToolkitTool])
+_PAGE_LIST_ADAPTER = TypeAdapter(list[Page])
+_BLOCK_LIST_ADAPTER = TypeAdapter(list[Block])
+_ROW_LIST_ADAPTER = TypeAdapter(list[DatabaseRow])
+_COMMENT_LIST_ADAPTER = TypeAdapter(list[Comment])
+_USER_LIST_ADAPTER = TypeAdapter(list[User])
+_SEARCH_RESULT_LIST_ADAPTER = TypeAdapter(list[SearchResult])
+_MEETING_LIST_ADAPTER = TypeAdapter(list[Meeting])
+_RECORDING_LIST_ADAPTER = TypeAdapter(list[Recording])
+_PARTICIPANT_LIST_ADAPTER = TypeAdapter(list[Participant])
 
 
 # ==================================================================
-# MANAGEMENT TOOLS (11 tools)
+# MANAGEMENT TOOLS (13 tools)
 # ==================================================================
 
 
@@ -58,9 +238,10 @@ async def list_toolkits(search: Optional[str] = None) -> str:
     Args:
         search: Optional search query to filter toolkits
     """
-    client = get_client()
+    client = clients.composio
+    # list_toolkits is cached for a few minutes, so repeat calls skip the API
     toolkits = await client.list_toolkits(search)
-    return json.dumps([t.model_dump(mode="json") for t in toolkits], indent=2)
+    return _TOOLKIT_LIST_ADAPTER.dump_json(toolkits, indent=_INDENT).decode()
 
 
 @mcp.tool()
@@ -70,9 +251,9 @@ async def get_toolkit_tools(toolkit_slug: str) -> str:
     Args:
         toolkit_slug: The toolkit slug (e.g., 'instagram', 'github', 'slack')
     """
-    client = get_client()
+    client = clients.composio
     tools = await client.get_toolkit_tools(toolkit_slug)
-    return json.dumps([t.model_dump(mode="json") for t in tools], indent=2)
+    return _TOOLKIT_TOOL_LIST_ADAPTER.dump_json(tools, indent=_INDENT).decode()
 
 
 @mcp.tool()
@@ -82,9 +263,8 @@ async def list_auth_configs(toolkit_slug: Optional[str] = None) -> str:
     Args:
         toolkit_slug: Filter by app slug (e.g., 'instagram')
     """
-    client = get_client()
-    configs = await client.list_auth_configs(toolkit_slug)
-    return json.dumps([c.model_dump(mode="json") for c in configs], indent=2)
+    client = clients.composio
+    return await _dumps_stream(client.iter_auth_configs(toolkit_slug))
 
 
 @mcp.tool()
@@ -94,9 +274,9 @@ async def get_auth_config(auth_config_id: str) -> str:
     Args:
         auth_config_id: The auth config ID
     """
-    client = get_client()
+    client = clients.composio
     config = await client.get_auth_config(auth_config_id)
-    return json.dumps(config.model_dump(mode="json"), indent=2)
+    return config.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -116,7 +296,7 @@ async def create_auth_config(
         use_composio_auth: Use Composio's managed OAuth credentials (recommended)
         scopes: Comma-separated OAuth scopes (e.g., 'read,write,publish')
     """
-    client = get_client()
+    client = clients.composio
     scope_list = [s.strip() for s in scopes.split(",")] if scopes else None
     config = await client.create_auth_config(
         toolkit_slug=toolkit_slug,
@@ -125,7 +305,7 @@ async def create_auth_config(
         use_composio_auth=use_composio_auth,
         scopes=scope_list,
     )
-    return json.dumps(config.model_dump(mode="json"), indent=2)
+    return config.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -135,9 +315,9 @@ async def delete_auth_config(auth_config_id: str) -> str:
     Args:
         auth_config_id: The auth config ID to delete
     """
-    client = get_client()
+    client = clients.composio
     result = await client.delete_auth_config(auth_config_id)
-    return json.dumps({"status": "deleted", "id": auth_config_id, **result})
+    return _dumps({"status": "deleted", "id": auth_config_id, **result}, indent=None)
 
 
 @mcp.tool()
@@ -153,9 +333,8 @@ async def list_connections(
         status: Filter by status - 'ACTIVE', 'INACTIVE', 'PENDING', 'EXPIRED', 'FAILED'
         user_id: Filter by user ID
     """
-    client = get_client()
-    connections = await client.list_connections(toolkit_slug, status, user_id)
-    return json.dumps([c.model_dump(mode="json") for c in connections], indent=2)
+    client = clients.composio
+    return await _dumps_stream(client.iter_connections(toolkit_slug, status, user_id))
 
 
 @mcp.tool()
@@ -165,9 +344,9 @@ async def get_connection(connection_id: str) -> str:
     Args:
         connection_id: The connected account ID
     """
-    client = get_client()
+    client = clients.composio
     connection = await client.get_connection(connection_id)
-    return json.dumps(connection.model_dump(mode="json"), indent=2)
+    return connection.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -185,13 +364,13 @@ async def initiate_connection(
         user_id: User identifier (default: 'default')
         callback_url: URL to redirect to after OAuth completes
     """
-    client = get_client()
+    client = clients.composio
     request = await client.initiate_connection(
         auth_config_id=auth_config_id,
         user_id=user_id,
         callback_url=callback_url,
     )
-    return json.dumps(request.model_dump(mode="json"), indent=2)
+    return request.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -207,13 +386,13 @@ async def initiate_connection_link(
         user_id: User identifier
         callback_url: URL to redirect to after completion
     """
-    client = get_client()
+    client = clients.composio
     request = await client.initiate_connection_link(
         auth_config_id=auth_config_id,
         user_id=user_id,
         callback_url=callback_url,
     )
-    return json.dumps(request.model_dump(mode="json"), indent=2)
+    return request.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -223,9 +402,9 @@ async def delete_connection(connection_id: str) -> str:
     Args:
         connection_id: The connected account ID to delete
     """
-    client = get_client()
+    client = clients.composio
     result = await client.delete_connection(connection_id)
-    return json.dumps({"status": "deleted", "id": connection_id, **result})
+    return _dumps({"status": "deleted", "id": connection_id, **result}, indent=None)
 
 
 @mcp.tool()
@@ -235,9 +414,9 @@ async def refresh_connection(connection_id: str) -> str:
     Args:
         connection_id: The connected account ID to refresh
     """
-    client = get_client()
+    client = clients.composio
     connection = await client.refresh_connection(connection_id)
-    return json.dumps(connection.model_dump(mode="json"), indent=2)
+    return connection.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -253,14 +432,14 @@ async def execute_action(
         connected_account_id: The connected account ID to use
         params: JSON string of action input parameters
     """
-    client = get_client()
-    parsed_params = json.loads(params) if params else {}
+    client = clients.composio
+    parsed_params = _JSON_OBJECT_ADAPTER.validate_json(params) if params else {}
     result = await client.execute_action(action, connected_account_id, parsed_params)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 # ==================================================================
-# NOTION TOOLS (28 tools)
+# NOTION TOOLS (35 tools)
 # ==================================================================
 
 
@@ -283,9 +462,9 @@ async def notion_create_page(
         icon: Optional emoji icon
         cover: Optional cover image URL
     """
-    notion = get_notion()
+    notion = clients.notion
     page = await notion.create_page(parent_id, title, parent_type, icon, cover)
-    return json.dumps(page.model_dump(mode="json"), indent=2)
+    return page.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -295,9 +474,21 @@ async def notion_get_page(page_id: str) -> str:
     Args:
         page_id: The Notion page ID
     """
-    notion = get_notion()
+    notion = clients.notion
     page = await notion.get_page(page_id)
-    return json.dumps(page.model_dump(mode="json"), indent=2)
+    return page.model_dump_json(indent=_INDENT)
+
+
+@mcp.tool()
+async def notion_get_pages(page_ids: list[str]) -> str:
+    """Get metadata for several Notion pages in one call.
+
+    Args:
+        page_ids: Notion page IDs
+    """
+    notion = clients.notion
+    pages = await notion.get_pages(page_ids)
+    return _PAGE_LIST_ADAPTER.dump_json(pages, indent=_INDENT).decode()
 
 
 @mcp.tool()
@@ -319,10 +510,10 @@ async def notion_update_page(
         archived: Archive/unarchive the page
         properties: JSON string of properties to update
     """
-    notion = get_notion()
-    props = json.loads(properties) if properties else None
+    notion = clients.notion
+    props = _JSON_OBJECT_ADAPTER.validate_json(properties) if properties else None
     page = await notion.update_page(page_id, title, icon, cover, archived, props)
-    return json.dumps(page.model_dump(mode="json"), indent=2)
+    return page.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -333,9 +524,9 @@ async def notion_archive_page(page_id: str, archived: bool = True) -> str:
         page_id: The page ID
         archived: True to archive, False to restore
     """
-    notion = get_notion()
+    notion = clients.notion
     page = await notion.archive_page(page_id, archived)
-    return json.dumps(page.model_dump(mode="json"), indent=2)
+    return page.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -345,9 +536,9 @@ async def notion_duplicate_page(page_id: str) -> str:
     Args:
         page_id: The page ID to duplicate
     """
-    notion = get_notion()
+    notion = clients.notion
     page = await notion.duplicate_page(page_id)
-    return json.dumps(page.model_dump(mode="json"), indent=2)
+    return page.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -357,9 +548,22 @@ async def notion_search_pages(query: str = "") -> str:
     Args:
         query: Search query
     """
-    notion = get_notion()
+    notion = clients.notion
     pages = await notion.search_pages(query)
-    return json.dumps([p.model_dump(mode="json") for p in pages], indent=2)
+    return _PAGE_LIST_ADAPTER.dump_json(pages, indent=_INDENT).decode()
+
+
+@mcp.tool()
+async def notion_search_pages_all(query: str = "", limit: Optional[int] = None) -> str:
+    """Search Notion pages by title, across every page of results.
+
+    Args:
+        query: Search query (empty lists all accessible pages)
+        limit: Stop after this many pages (default: all)
+    """
+    notion = clients.notion
+    pages = notion.iter_search_pages(query, _page_size_for(limit))
+    return await _dumps_stream(_take(pages, limit))
 
 
 @mcp.tool()
@@ -370,9 +574,9 @@ async def notion_get_page_property(page_id: str, property_id: str) -> str:
         page_id: The page ID
         property_id: The property ID
     """
-    notion = get_notion()
+    notion = clients.notion
     result = await notion.get_page_property(page_id, property_id)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 # --- Blocks ---
@@ -385,9 +589,10 @@ async def notion_add_content_blocks(page_id: str, blocks: str) -> str:
         page_id: The page ID
         blocks: JSON array of blocks, e.g. [{"type": "paragraph", "text": "Hello"}]
     """
-    notion = get_notion()
-    result = await notion.add_content_blocks(page_id, json.loads(blocks))
-    return json.dumps(result, indent=2)
+    notion = clients.notion
+    parsed = _JSON_OBJECT_LIST_ADAPTER.validate_json(blocks)
+    result = await notion.add_content_blocks(page_id, parsed)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -398,9 +603,10 @@ async def notion_append_complex_blocks(block_id: str, children: str) -> str:
         block_id: Parent block or page ID
         children: JSON array of full Notion block objects
     """
-    notion = get_notion()
-    result = await notion.append_complex_blocks(block_id, json.loads(children))
-    return json.dumps(result, indent=2)
+    notion = clients.notion
+    parsed = _JSON_OBJECT_LIST_ADAPTER.validate_json(children)
+    result = await notion.append_complex_blocks(block_id, parsed)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -410,27 +616,40 @@ async def notion_get_block(block_id: str) -> str:
     Args:
         block_id: The block ID
     """
-    notion = get_notion()
+    notion = clients.notion
     block = await notion.get_block(block_id)
-    return json.dumps(block.model_dump(mode="json"), indent=2)
+    return block.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
 async def notion_get_block_children(
     block_id: str,
     start_cursor: Optional[str] = None,
-    page_size: int = 100,
+    page_size: int = 25,
 ) -> str:
     """Get child blocks of a Notion block or page.
 
     Args:
         block_id: Parent block or page ID
         start_cursor: Pagination cursor
-        page_size: Number of results (max 100)
+        page_size: Number of results (default 25, max 100)
     """
-    notion = get_notion()
+    notion = clients.notion
     blocks = await notion.get_block_children(block_id, start_cursor, page_size)
-    return json.dumps([b.model_dump(mode="json") for b in blocks], indent=2)
+    return _BLOCK_LIST_ADAPTER.dump_json(blocks, indent=_INDENT).decode()
+
+
+@mcp.tool()
+async def notion_get_block_children_all(block_id: str, limit: Optional[int] = None) -> str:
+    """Get all child blocks of a Notion block or page, across every page.
+
+    Args:
+        block_id: Parent block or page ID
+        limit: Stop after this many blocks (default: all)
+    """
+    notion = clients.notion
+    blocks = notion.iter_block_children(block_id, _page_size_for(limit))
+    return await _dumps_stream(_take(blocks, limit))
 
 
 @mcp.tool()
@@ -441,9 +660,10 @@ async def notion_update_block(block_id: str, updates: str) -> str:
         block_id: The block ID
         updates: JSON object of block-type-specific fields to update
     """
-    notion = get_notion()
-    block = await notion.update_block(block_id, **json.loads(updates))
-    return json.dumps(block.model_dump(mode="json"), indent=2)
+    notion = clients.notion
+    parsed = _JSON_OBJECT_ADAPTER.validate_json(updates)
+    block = await notion.update_block(block_id, **parsed)
+    return block.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -453,9 +673,9 @@ async def notion_delete_block(block_id: str) -> str:
     Args:
         block_id: The block ID
     """
-    notion = get_notion()
+    notion = clients.notion
     result = await notion.delete_block(block_id)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 # --- Databases ---
@@ -473,9 +693,10 @@ async def notion_create_database(
         title: Database title
         properties: JSON object of database property schema
     """
-    notion = get_notion()
-    db = await notion.create_database(parent_id, title, json.loads(properties))
-    return json.dumps(db.model_dump(mode="json"), indent=2)
+    notion = clients.notion
+    props = _JSON_OBJECT_ADAPTER.validate_json(properties)
+    db = await notion.create_database(parent_id, title, props)
+    return db.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -485,9 +706,9 @@ async def notion_get_database(database_id: str) -> str:
     Args:
         database_id: The database ID
     """
-    notion = get_notion()
+    notion = clients.notion
     db = await notion.get_database(database_id)
-    return json.dumps(db.model_dump(mode="json"), indent=2)
+    return db.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -495,7 +716,7 @@ async def notion_query_database(
     database_id: str,
     filter: Optional[str] = None,
     sorts: Optional[str] = None,
-    page_size: int = 100,
+    page_size: int = 25,
     start_cursor: Optional[str] = None,
 ) -> str:
     """Query a Notion database for rows.
@@ -504,14 +725,135 @@ async def notion_query_database(
         database_id: The database ID
         filter: JSON Notion filter object
         sorts: JSON array of Notion sort objects
-        page_size: Number of results (max 100)
+        page_size: Number of results (default 25, max 100)
         start_cursor: Pagination cursor
     """
-    notion = get_notion()
-    f = json.loads(filter) if filter else None
-    s = json.loads(sorts) if sorts else None
+    notion = clients.notion
+    f = _JSON_OBJECT_ADAPTER.validate_json(filter) if filter else None
+    s = _JSON_OBJECT_LIST_ADAPTER.validate_json(sorts) if sorts else None
     rows = await notion.query_database(database_id, f, s, page_size, start_cursor)
-    return json.dumps([r.model_dump(mode="json") for r in rows], indent=2)
+    return _ROW_LIST_ADAPTER.dump_json(rows, indent=_INDENT).decode()
+
+
+@mcp.tool()
+async def notion_query_database_all(
+    database_id: str,
+    filter: Optional[str] = None,
+    sorts: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> str:
+    """Query a Notion database for all matching rows, across every page.
+
+    Args:
+        database_id: The database ID
+        filter: JSON Notion filter object
+        sorts: JSON array of Notion sort objects
+        limit: Stop after this many rows (default: all)
+    """
+    notion = clients.notion
+    f = _JSON_OBJECT_ADAPTER.validate_json(filter) if filter else None
+    s = _JSON_OBJECT_LIST_ADAPTER.validate_json(sorts) if sorts else None
+    rows = notion.iter_database_rows(database_id, f, s, _page_size_for(limit))
+    return await _dumps_stream(_take(rows, limit))
+
+
+# Queries opened with notion_open_query live in clients.queries, keyed by
+# resource URI. Only the query is kept; each page is fetched on demand with
+# Notion's cursor.
+_MAX_QUERIES = 256
+
+
+def _query_owner(ctx: Context) -> Optional[str]:
+    """Token for the MCP session a query belongs to (None outside a request).
+
+    Unlike id(session), a token is never reused by a later session. A
+    session's queries are dropped once it is gone.
+    """
+    try:
+        session = ctx.session
+    except ValueError:
+        return None
+    owners = clients.query_owners
+    token = owners.get(session)
+    if token is None:
+        token = owners[session] = uuid.uuid4().hex
+        weakref.finalize(session, _drop_queries, token)
+    return token
+
+
+def _drop_queries(owner: str) -> None:
+    """Forget every open query of a closed session."""
+    queries = clients.__dict__.get("queries")
+    if queries:
+        for resource in [r for r, q in queries.items() if q[0] == owner]:
+            del queries[resource]
+
+
+async def _query_page(
+    resource: str, query: tuple, page_size: int, cursor: Optional[str]
+) -> str:
+    _, database_id, f, s = query
+    notion = clients.notion
+    rows, next_cursor = await notion.query_database_page(database_id, f, s, page_size, cursor)
+    return _dumps({
+        "resource": resource,
+        "next_cursor": next_cursor,
+        "results": _ROW_LIST_ADAPTER.dump_python(rows, mode="json"),
+    })
+
+
+@mcp.tool()
+async def notion_open_query(
+    ctx: Context,
+    database_id: str,
+    filter: Optional[str] = None,
+    sorts: Optional[str] = None,
+    page_size: int = 100,
+) -> str:
+    """Start a large Notion database query and return its first page.
+
+    The response carries a resource URI and next_cursor; pass both to
+    notion_fetch_query_page for the following pages instead of repeating
+    the filter and sorts. Prefer this over notion_query_database_all when
+    the result may be too large for one response.
+
+    Args:
+        database_id: The database ID
+        filter: JSON Notion filter object
+        sorts: JSON array of Notion sort objects
+        page_size: Rows per page (max 100)
+    """
+    f = _JSON_OBJECT_ADAPTER.validate_json(filter) if filter else None
+    s = _JSON_OBJECT_LIST_ADAPTER.validate_json(sorts) if sorts else None
+    resource = f"notion-query://{uuid.uuid4()}"
+    query = (_query_owner(ctx), database_id, f, s)
+    page = await _query_page(resource, query, page_size, None)
+    # Register only once the first page came back, so failed opens leave
+    # nothing behind
+    queries = clients.queries
+    queries[resource] = query
+    while len(queries) > _MAX_QUERIES:
+        queries.popitem(last=False)
+    return page
+
+
+@mcp.tool()
+async def notion_fetch_query_page(
+    ctx: Context, resource: str, cursor: str, page_size: int = 100
+) -> str:
+    """Fetch the next page of a query started with notion_open_query.
+
+    Args:
+        resource: The resource URI returned by notion_open_query
+        cursor: The next_cursor from the previous page
+        page_size: Rows per page (max 100)
+    """
+    queries = clients.queries
+    query = queries.get(resource)
+    if query is None or query[0] != _query_owner(ctx):
+        raise ValueError(f"Unknown or expired query resource: {resource}")
+    queries.move_to_end(resource)
+    return await _query_page(resource, query, page_size, cursor)
 
 
 @mcp.tool()
@@ -522,9 +864,10 @@ async def notion_create_database_row(database_id: str, properties: str) -> str:
         database_id: The database ID
         properties: JSON object of row property values
     """
-    notion = get_notion()
-    row = await notion.create_database_row(database_id, json.loads(properties))
-    return json.dumps(row.model_dump(mode="json"), indent=2)
+    notion = clients.notion
+    props = _JSON_OBJECT_ADAPTER.validate_json(properties)
+    row = await notion.create_database_row(database_id, props)
+    return row.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -534,9 +877,9 @@ async def notion_get_database_row(row_id: str) -> str:
     Args:
         row_id: The row (page) ID
     """
-    notion = get_notion()
+    notion = clients.notion
     row = await notion.get_database_row(row_id)
-    return json.dumps(row.model_dump(mode="json"), indent=2)
+    return row.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -552,10 +895,10 @@ async def notion_update_database_row(
         properties: JSON object of properties to update
         archived: Archive/unarchive the row
     """
-    notion = get_notion()
-    props = json.loads(properties) if properties else None
+    notion = clients.notion
+    props = _JSON_OBJECT_ADAPTER.validate_json(properties) if properties else None
     row = await notion.update_database_row(row_id, props, archived)
-    return json.dumps(row.model_dump(mode="json"), indent=2)
+    return row.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -573,10 +916,10 @@ async def notion_update_database_schema(
         description: New description
         properties: JSON object of properties to add/update
     """
-    notion = get_notion()
-    props = json.loads(properties) if properties else None
+    notion = clients.notion
+    props = _JSON_OBJECT_ADAPTER.validate_json(properties) if properties else None
     db = await notion.update_database_schema(database_id, title, description, props)
-    return json.dumps(db.model_dump(mode="json"), indent=2)
+    return db.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -587,9 +930,9 @@ async def notion_get_database_property(database_id: str, property_id: str) -> st
         database_id: The database ID
         property_id: The property ID
     """
-    notion = get_notion()
+    notion = clients.notion
     result = await notion.get_database_property(database_id, property_id)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 # --- Comments ---
@@ -607,9 +950,9 @@ async def notion_create_comment(
         rich_text: Comment text
         discussion_id: Discussion ID to reply to an existing thread
     """
-    notion = get_notion()
+    notion = clients.notion
     comment = await notion.create_comment(parent_id, rich_text, discussion_id)
-    return json.dumps(comment.model_dump(mode="json"), indent=2)
+    return comment.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -619,9 +962,9 @@ async def notion_get_comments(block_id: str) -> str:
     Args:
         block_id: Block or page ID
     """
-    notion = get_notion()
+    notion = clients.notion
     comments = await notion.get_comments(block_id)
-    return json.dumps([c.model_dump(mode="json") for c in comments], indent=2)
+    return _COMMENT_LIST_ADAPTER.dump_json(comments, indent=_INDENT).decode()
 
 
 @mcp.tool()
@@ -631,9 +974,9 @@ async def notion_get_comment(comment_id: str) -> str:
     Args:
         comment_id: The comment ID
     """
-    notion = get_notion()
+    notion = clients.notion
     comment = await notion.get_comment(comment_id)
-    return json.dumps(comment.model_dump(mode="json"), indent=2)
+    return comment.model_dump_json(indent=_INDENT)
 
 
 # --- Users ---
@@ -641,9 +984,9 @@ async def notion_get_comment(comment_id: str) -> str:
 @mcp.tool()
 async def notion_get_current_user() -> str:
     """Get the bot user for this Notion integration."""
-    notion = get_notion()
+    notion = clients.notion
     user = await notion.get_current_user()
-    return json.dumps(user.model_dump(mode="json"), indent=2)
+    return user.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -653,17 +996,17 @@ async def notion_get_user(user_id: str) -> str:
     Args:
         user_id: The user ID
     """
-    notion = get_notion()
+    notion = clients.notion
     user = await notion.get_user(user_id)
-    return json.dumps(user.model_dump(mode="json"), indent=2)
+    return user.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
 async def notion_list_users() -> str:
     """List all users in the Notion workspace."""
-    notion = get_notion()
+    notion = clients.notion
     users = await notion.list_users()
-    return json.dumps([u.model_dump(mode="json") for u in users], indent=2)
+    return _USER_LIST_ADAPTER.dump_json(users, indent=_INDENT).decode()
 
 
 # --- Workspace ---
@@ -672,22 +1015,41 @@ async def notion_list_users() -> str:
 async def notion_search_workspace(
     query: str = "",
     filter_type: Optional[str] = None,
-    page_size: int = 100,
+    page_size: int = 25,
 ) -> str:
     """Search the entire Notion workspace for pages and databases.
 
     Args:
         query: Search query
         filter_type: 'page' or 'database' to filter results (None for all)
-        page_size: Number of results (max 100)
+        page_size: Number of results (default 25, max 100)
     """
-    notion = get_notion()
+    notion = clients.notion
     results = await notion.search_workspace(query, filter_type, page_size)
-    return json.dumps([r.model_dump(mode="json") for r in results], indent=2)
+    return _SEARCH_RESULT_LIST_ADAPTER.dump_json(results, indent=_INDENT).decode()
+
+
+@mcp.tool()
+async def notion_invalidate_cache(resource_id: Optional[str] = None) -> str:
+    """Forget cached Notion reads so the next call refetches.
+
+    Reads are cached for COMPOSIO_CACHE_TTL seconds (default 30) and dropped
+    automatically when changed through this server; use this after editing
+    in Notion directly.
+
+    Args:
+        resource_id: Page, block, database, comment or user ID (None for all)
+    """
+    notion = clients.notion
+    if resource_id:
+        notion.invalidate_cache(resource_id)
+    else:
+        notion.invalidate_cache()
+    return _dumps({"status": "invalidated", "id": resource_id}, indent=None)
 
 
 # ==================================================================
-# ZOOM TOOLS (9 tools)
+# ZOOM TOOLS (11 tools)
 # ==================================================================
 
 
@@ -700,9 +1062,9 @@ async def zoom_list_meetings(meeting_type: str = "upcoming") -> str:
     Args:
         meeting_type: Type of meetings - 'upcoming', 'scheduled', 'live', or 'pending'
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     meetings = await zoom.list_meetings(meeting_type)
-    return json.dumps([m.model_dump(mode="json") for m in meetings], indent=2)
+    return _MEETING_LIST_ADAPTER.dump_json(meetings, indent=_INDENT).decode()
 
 
 @mcp.tool()
@@ -726,7 +1088,7 @@ async def zoom_create_meeting(
         waiting_room: Enable waiting room (default: True)
         auto_recording: 'cloud', 'local', or 'none' (default: cloud)
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     meeting = await zoom.create_meeting(MeetingCreate(
         topic=topic,
         start_time=start_time,
@@ -736,7 +1098,7 @@ async def zoom_create_meeting(
         waiting_room=waiting_room,
         auto_recording=auto_recording,
     ))
-    return json.dumps(meeting.model_dump(mode="json"), indent=2)
+    return meeting.model_dump_json(indent=_INDENT)
 
 
 @mcp.tool()
@@ -746,9 +1108,21 @@ async def zoom_get_meeting(meeting_id: int) -> str:
     Args:
         meeting_id: The Zoom meeting ID
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     meeting = await zoom.get_meeting(meeting_id)
-    return json.dumps(meeting.model_dump(mode="json"), indent=2)
+    return meeting.model_dump_json(indent=_INDENT)
+
+
+@mcp.tool()
+async def zoom_get_meetings(meeting_ids: list[int]) -> str:
+    """Get details for several Zoom meetings in one call.
+
+    Args:
+        meeting_ids: Zoom meeting IDs
+    """
+    zoom = clients.zoom
+    meetings = await zoom.get_meetings(meeting_ids)
+    return _MEETING_LIST_ADAPTER.dump_json(meetings, indent=_INDENT).decode()
 
 
 @mcp.tool()
@@ -768,9 +1142,9 @@ async def zoom_update_meeting(
         duration: New duration in minutes (optional)
         agenda: New agenda (optional)
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     await zoom.update_meeting(meeting_id, topic, start_time, duration, agenda)
-    return json.dumps({"status": "updated", "meeting_id": meeting_id})
+    return _dumps({"status": "updated", "meeting_id": meeting_id}, indent=None)
 
 
 @mcp.tool()
@@ -780,9 +1154,9 @@ async def zoom_delete_meeting(meeting_id: int) -> str:
     Args:
         meeting_id: The Zoom meeting ID to delete
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     await zoom.delete_meeting(meeting_id)
-    return json.dumps({"status": "deleted", "meeting_id": meeting_id})
+    return _dumps({"status": "deleted", "meeting_id": meeting_id}, indent=None)
 
 
 @mcp.tool()
@@ -800,24 +1174,38 @@ async def zoom_add_registrant(
         first_name: Registrant's first name
         last_name: Registrant's last name (optional)
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     registrant = await zoom.add_registrant(meeting_id, email, first_name, last_name)
-    return json.dumps(registrant.model_dump(mode="json"), indent=2)
+    return registrant.model_dump_json(indent=_INDENT)
 
 
 # --- Recordings ---
 
 @mcp.tool()
-async def zoom_list_recordings(from_date: str, to_date: Optional[str] = None) -> str:
+async def zoom_list_recordings(
+    from_date: str,
+    to_date: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> str:
     """List Zoom cloud recordings in a date range.
 
     Args:
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD, optional)
+        limit: Stop after this many recordings (default: all)
     """
-    zoom = get_zoom()
-    recordings = await zoom.list_recordings(from_date, to_date)
-    return json.dumps([r.model_dump(mode="json") for r in recordings], indent=2)
+    zoom = clients.zoom
+    if limit is None:
+        recordings = await zoom.list_recordings(from_date, to_date)
+        return _RECORDING_LIST_ADAPTER.dump_json(recordings, indent=_INDENT).decode()
+
+    async def iter_recordings() -> AsyncIterator[Recording]:
+        async with aclosing(zoom.iter_recording_pages(from_date, to_date)) as pages:
+            async for page in pages:
+                for r in page:
+                    yield r
+
+    return await _dumps_stream(_take(iter_recordings(), limit))
 
 
 @mcp.tool()
@@ -827,9 +1215,9 @@ async def zoom_get_recording(meeting_id: int) -> str:
     Args:
         meeting_id: The Zoom meeting ID
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     recording = await zoom.get_recording(meeting_id)
-    return json.dumps(recording.model_dump(mode="json"), indent=2)
+    return recording.model_dump_json(indent=_INDENT)
 
 
 # --- Post-meeting ---
@@ -841,9 +1229,9 @@ async def zoom_get_participants(meeting_id: int) -> str:
     Args:
         meeting_id: The Zoom meeting ID (must be a past meeting)
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     participants = await zoom.get_participants(meeting_id)
-    return json.dumps([p.model_dump(mode="json") for p in participants], indent=2)
+    return _PARTICIPANT_LIST_ADAPTER.dump_json(participants, indent=_INDENT).decode()
 
 
 @mcp.tool()
@@ -853,10 +1241,20 @@ async def zoom_get_meeting_summary(meeting_id: int) -> str:
     Args:
         meeting_id: The Zoom meeting ID
     """
-    zoom = get_zoom()
+    zoom = clients.zoom
     summary = await zoom.get_meeting_summary(meeting_id)
-    return json.dumps(summary.model_dump(mode="json"), indent=2)
+    return summary.model_dump_json(indent=_INDENT)
+
+
+def main():
+    """Run the stdio server, on uvloop when it is installed ('fast' extra)."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+    else:
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
 
 
 if __name__ == "__main__":
-    mcp.run()
+    main()
@@ -0,0 +1,172 @@
+"""Short-lived caching for read-only client methods.
+
+Clients hold a TTLCache in ``self._cache``. Read methods decorated with
+@cached serve repeat calls from it; mutating methods decorated with
+@invalidates drop every entry that mentions the resource they changed
+(and its parent).
+Reads decorated with @single_flight aren't cached, but concurrent
+identical calls share one request.
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire ``ttl`` seconds after being set.
+
+    A ttl of 0 disables caching entirely.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        # Bumped on every invalidation so reads that started before a
+        # mutation don't store what they fetched
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the live value for key, or _MISSING."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *values: Any) -> None:
+        """Drop entries whose arguments include any of values (all if none)."""
+        self._generation += 1
+        if not values:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if any(v in k[1] for v in values)]:
+            del self._entries[key]
+
+    async def shared(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await call(), joining an identical call already in flight."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(future)
+
+
+def _copy(value: Any) -> Any:
+    """Copy a shared result for one caller.
+
+    Lists are copied shallowly (frozen models inside are shared); raw dicts
+    are copied deeply, since nothing stops a caller mutating them.
+    """
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return copy.deepcopy(value)
+    return value
+
+
+def _call_key(method: Callable, args: tuple, kwargs: dict) -> tuple:
+    return (method.__name__, (*args, *kwargs.values()), tuple(kwargs))
+
+
+def cached(method: Callable) -> Callable:
+    """Serve an async client method from ``self._cache``.
+
+    Entries are keyed by method name and arguments, and concurrent misses
+    for the same key share one request. Each caller gets its own copy of
+    list and dict results (see _copy).
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        cache = self._cache
+        key = _call_key(method, args, kwargs)
+        try:
+            value = cache.get(key)
+        except TypeError:
+            # Unhashable arguments; don't cache
+            return await method(self, *args, **kwargs)
+        if value is _MISSING:
+            generation = cache._generation
+
+            async def fetch() -> Any:
+                result = await method(self, *args, **kwargs)
+                if cache._generation == generation:
+                    cache.set(key, result)
+                return result
+
+            value = await cache.shared(key, fetch)
+        return _copy(value)
+
+    return wrapper
+
+
+def single_flight(method: Callable) -> Callable:
+    """Let concurrent identical calls of an async client method share one request.
+
+    For reads whose results shouldn't be reused once they complete, such as
+    queries and searches.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = _call_key(method, args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            # Filters and sorts arrive as dicts; key on their JSON instead
+            key = (method.__name__, json.dumps([args, kwargs], sort_keys=True, default=str))
+        value = await self._cache.shared(key, lambda: method(self, *args, **kwargs))
+        return _copy(value)
+
+    return wrapper
+
+
+def invalidates(method: Callable) -> Callable:
+    """Drop cached reads that mention the method's first argument.
+
+    Runs whether or not the mutation succeeds, since a failed call may
+    still have changed the resource server-side. When the result has a
+    ``parent_id`` (e.g. a created or edited Notion page or block), reads
+    of the parent are dropped too, since its children have changed.
+    """
+
+    id_param = list(inspect.signature(method).parameters)[1]
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        result = None
+        try:
+            result = await method(self, *args, **kwargs)
+            return result
+        finally:
+            ids = (args[0] if args else kwargs.get(id_param), getattr(result, "parent_id", None))
+            # Never pass an empty list; invalidate() would clear everything
+            ids = [i for i in ids if i]
+            if ids:
+                self._cache.invalidate(*ids)
+
+    return wrapper
@@ -0,0 +1,39 @@
+"""JSON encoding/decoding that uses orjson when installed.
+
+orjson is optional (``pip install mcp-composio[fast]``); without it these
+helpers fall back to the stdlib json module with equivalent output.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize obj to a JSON string.
+
+    Args:
+        obj: JSON-compatible value
+        indent: Pretty-print with this indent (orjson only supports 2)
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the stdlib handle it
+            pass
+    if indent is None:
+        return json.dumps(obj, separators=(",", ":"))
+    return json.dumps(obj, indent=indent)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
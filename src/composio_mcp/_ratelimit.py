@@ -0,0 +1,44 @@
+"""Client-side pacing for outbound Composio action calls."""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per second.
+
+    Up to ``burst`` calls (default: one second's worth) go through at once;
+    beyond that callers wait their turn in FIFO order instead of tripping
+    the API's 429 back-off.
+
+    Usage:
+        limiter = RateLimiter(3)
+        async with limiter:
+            await do_request()
+    """
+
+    def __init__(self, rate: float, burst: float = 0):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                # Holding the lock while sleeping keeps waiters in order
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
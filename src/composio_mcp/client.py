@@ -17,12 +17,18 @@ Usage:
     zoom = ZoomClient.from_env()
 """
 
-import json
+import asyncio
+import importlib.util
 import os
-from typing import Any, Optional
+import random
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, TypeVar, Union
 
 import httpx
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter, create_model
 
+from . import _json
+from ._cache import _MISSING, TTLCache, cached
+from ._ratelimit import RateLimiter
 from .models import (
     AuthConfig,
     ConnectedAccount,
@@ -34,62 +40,198 @@ from .models import (
 
 def _load_api_key() -> Optional[str]:
     """Load Composio API key from AWS Secrets Manager or environment."""
-    api_key = None
-    try:
-        import boto3
-        client = boto3.client("secretsmanager", region_name="us-east-1")
-        secret = json.loads(
-            client.get_secret_value(SecretId="composio/api-key")["SecretString"]
-        )
-        api_key = secret.get("api_key")
-    except Exception:
-        pass
-    return api_key or os.environ.get("COMPOSIO_API_KEY")
+    return _load_secret().get("api_key") or os.environ.get("COMPOSIO_API_KEY")
+
+
+def create_http_client(
+    timeout: float = 30.0,
+    max_connections: int = 100,
+    keepalive_expiry: float = 30.0,
+    http2: Optional[bool] = None,
+    connect_retries: int = 2,
+) -> httpx.AsyncClient:
+    """Create a pooled httpx client that can be shared across Composio clients.
+
+    Pass the result as ``http_client=`` to any client constructor (or
+    ``from_env()``) so they reuse one keep-alive connection pool. The caller
+    owns the returned client and is responsible for closing it.
+
+    Args:
+        timeout: Request timeout in seconds
+        max_connections: Pool size; every connection may be kept alive
+        keepalive_expiry: Seconds an idle connection stays in the pool
+        http2: Multiplex requests over HTTP/2 (default: when h2 is installed,
+            e.g. via the 'fast' extra)
+        connect_retries: Times to retry a failed connection attempt
+    """
+    if http2 is None:
+        http2 = importlib.util.find_spec("h2") is not None
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        retries=connect_retries,
+    )
+    return httpx.AsyncClient(timeout=timeout, transport=transport)
+
+
+# The composio/api-key secret once it has been loaded successfully
+_secret: Optional[dict] = None
 
 
 def _load_secret() -> dict:
-    """Load the full composio/api-key secret as a dict."""
+    """Load the full composio/api-key secret as a dict.
+
+    A successful lookup is kept for the process, so building several clients
+    costs at most one Secrets Manager round-trip. Timeouts are short and
+    retries off so that hosts without AWS access fall back to environment
+    variables quickly; failures aren't remembered, so a transient AWS error
+    doesn't stick until restart.
+    """
+    global _secret
+    if _secret is not None:
+        return _secret
     try:
         import boto3
-        client = boto3.client("secretsmanager", region_name="us-east-1")
-        return json.loads(
+        from botocore.config import Config
+
+        client = boto3.session.Session().client(
+            "secretsmanager",
+            region_name="us-east-1",
+            config=Config(connect_timeout=1, read_timeout=2, retries={"max_attempts": 1}),
+        )
+        _secret = _json.loads(
             client.get_secret_value(SecretId="composio/api-key")["SecretString"]
         )
     except Exception:
         return {}
+    return _secret
+
+
+def _page_adapter(item_model: type[BaseModel], items_key: str) -> TypeAdapter:
+    """Build a TypeAdapter that decodes one v3 list page straight from JSON.
+
+    Pages are either a bare list of items or an object holding them under
+    ``items`` (or items_key) next to ``next_cursor`` and ``total_pages``.
+    """
+    page_model = create_model(
+        f"_{item_model.__name__}Page",
+        items=(
+            list[item_model],
+            Field(default_factory=list, validation_alias=AliasChoices("items", items_key)),
+        ),
+        next_cursor=(Optional[Union[int, str]], None),
+        total_pages=(Optional[int], None),
+    )
+    return TypeAdapter(Union[page_model, list[item_model]])
+
+
+_TOOLKIT_PAGE_ADAPTER = _page_adapter(Toolkit, "toolkits")
+_AUTH_CONFIG_PAGE_ADAPTER = _page_adapter(AuthConfig, "auth_configs")
+_CONNECTION_PAGE_ADAPTER = _page_adapter(ConnectedAccount, "connected_accounts")
+
+
+T = TypeVar("T")
+
+# Statuses worth retrying: rate limiting and transient gateway failures
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 3
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After, else jittered backoff."""
+    retry_after = response.headers.get("Retry-After", "")
+    try:
+        return min(float(retry_after), 30.0)
+    except ValueError:
+        return min(8.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.5)
+
+
+def _should_retry(response: httpx.Response, idempotent: bool) -> bool:
+    """Whether a failed response is safe to send again.
+
+    A 502/504 from a gateway may come after the upstream write went through,
+    so those are only retried for idempotent requests. Writes retry only
+    when the request was provably not processed: a 429, or a 503 carrying
+    Retry-After.
+    """
+    status = response.status_code
+    if status == 429 or (status == 503 and "Retry-After" in response.headers):
+        return True
+    return idempotent and status in _RETRY_STATUSES
+
+
+async def _send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    idempotent: bool = True,
+) -> httpx.Response:
+    """Call send(), retrying rate-limited and transient failures with backoff.
+
+    Notion in particular sheds load with 429s and intermittent 502s; a short
+    retry here turns those into sub-second recoveries instead of tool
+    failures the agent has to repeat. Pass idempotent=False for writes and
+    action executions (see _should_retry).
+    """
+    for attempt in range(_MAX_RETRIES):
+        response = await send()
+        if not _should_retry(response, idempotent):
+            return response
+        await asyncio.sleep(_retry_delay(response, attempt))
+    return await send()
 
 
 class _BaseClient:
     """Shared base for domain-specific Composio clients (Notion, Zoom, etc.).
 
     Handles httpx setup, Composio v2 action execution, and credential loading.
+    Pass ``http_client`` (see create_http_client) to share one connection pool
+    between clients; the caller then owns it and close() leaves it open.
     """
 
     COMPOSIO_BASE_URL = "https://backend.composio.dev/api/v2/actions"
+    # Default outbound actions per second (None: unlimited); see rate_limit
+    RATE_LIMIT: Optional[float] = None
+    # Per-ID lookups run at once by batch methods such as get_pages
+    BATCH_CONCURRENCY = 5
 
     def __init__(
         self,
         composio_api_key: str,
         connected_account_id: str,
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache_ttl: Optional[float] = None,
+        rate_limit: Optional[float] = None,
     ):
         self.composio_api_key = composio_api_key
         self.connected_account_id = connected_account_id
-        self._client = httpx.AsyncClient(
-            headers={
-                "X-API-Key": composio_api_key,
-                "Content-Type": "application/json",
-            },
-            timeout=timeout,
-        )
+        # Read-only lookups (see _cache.cached) are reused for cache_ttl
+        # seconds; COMPOSIO_CACHE_TTL=0 turns this off
+        if cache_ttl is None:
+            cache_ttl = float(os.environ.get("COMPOSIO_CACHE_TTL", "30"))
+        self._cache = TTLCache(ttl=cache_ttl)
+        # Pace actions to the upstream API's rate limit; 0 disables
+        if rate_limit is None:
+            rate_limit = self.RATE_LIMIT
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._headers = {
+            "X-API-Key": composio_api_key,
+            "Content-Type": "application/json",
+        }
+        self._owns_client = http_client is None
+        self._client = http_client or create_http_client(timeout=timeout)
 
     @classmethod
-    def _from_env(cls, secret_key: str, env_key: str) -> "_BaseClient":
+    def _from_env(cls, secret_key: str, env_key: str, **kwargs: Any) -> "_BaseClient":
         """Create client from AWS Secrets Manager or environment variables.
 
         Args:
             secret_key: Key in the composio/api-key secret for the connected account ID
             env_key: Environment variable name for the connected account ID
+            **kwargs: Passed through to the constructor (e.g. http_client)
         """
         secret = _load_secret()
         api_key = secret.get("api_key") or os.environ.get("COMPOSIO_API_KEY")
@@ -101,20 +243,50 @@ class _BaseClient:
                 "or store in AWS Secrets Manager at composio/api-key"
             )
 
-        return cls(composio_api_key=api_key, connected_account_id=account_id)
+        return cls(composio_api_key=api_key, connected_account_id=account_id, **kwargs)
 
-    async def _execute(self, action: str, params: dict) -> dict:
-        """Execute a Composio action and return the unwrapped result."""
-        response = await self._client.post(
-            f"{self.COMPOSIO_BASE_URL}/{action}/execute",
-            json={
-                "connectedAccountId": self.connected_account_id,
-                "input": params,
-            },
-        )
+    def invalidate_cache(self, *resource_ids: str) -> None:
+        """Forget cached reads of the given resources (everything if none)."""
+        self._cache.invalidate(*resource_ids)
+
+    async def _gather(self, coros: Iterable[Awaitable[T]]) -> list[T]:
+        """Await coros concurrently, BATCH_CONCURRENCY at a time, preserving order.
+
+        Batch methods use this to fan out per-ID lookups; the rate limiter
+        still paces the underlying actions.
+        """
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def run(coro: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(c) for c in coros))
+
+    async def _execute(self, action: str, params: dict, idempotent: bool = False) -> dict:
+        """Execute a Composio action and return the unwrapped result.
+
+        Args:
+            action: Composio action slug
+            params: Action input
+            idempotent: The action only reads, so it may be resent after a
+                502/504 (see _should_retry); leave False for writes
+        """
+        body = {"connectedAccountId": self.connected_account_id, "input": params}
+
+        async def send() -> httpx.Response:
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            return await self._client.post(
+                f"{self.COMPOSIO_BASE_URL}/{action}/execute",
+                content=_json.dumps(body),
+                headers=self._headers,
+            )
+
+        response = await _send_with_retry(send, idempotent=idempotent)
         response.raise_for_status()
 
-        data = response.json()
+        data = _json.loads(response.content)
         if not data.get("successful"):
             raise Exception(f"Action {action} failed: {data.get('error')}")
 
@@ -125,8 +297,9 @@ class _BaseClient:
         return result
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client (unless it was provided by the caller)."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self):
         return self
@@ -136,44 +309,179 @@ class _BaseClient:
 
 
 class ComposioClient:
-    """Composio REST API v3 management client."""
+    """Composio REST API v3 management client.
+
+    List pages are decoded from the response bytes straight into models by
+    the _*_PAGE_ADAPTERs, and single items are parsed with model_validate;
+    both rely on the models' validation aliases for alternate key names.
+    """
 
     BASE_URL = "https://backend.composio.dev/api/v3"
 
-    def __init__(self, api_key: str, timeout: float = 30.0):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: Optional[int] = None,
+    ):
         self.api_key = api_key
-        self._client = httpx.AsyncClient(
-            headers={
-                "X-API-Key": api_key,
-                "Content-Type": "application/json",
-            },
-            timeout=timeout,
+        # Upper bound on concurrent page requests when listing
+        self.max_concurrency = max_concurrency or int(
+            os.environ.get("COMPOSIO_MAX_CONCURRENCY", "4")
         )
+        # In-flight refresh_connection requests, keyed by connection ID
+        self._refreshes: dict[str, asyncio.Future] = {}
+        # v3 ca_* IDs resolved to deprecated UUIDs for v2 execute; the
+        # mapping never changes for an account
+        self._uuids = TTLCache(maxsize=1024, ttl=86400)
+        # The toolkit catalog barely changes; see @cached below
+        self._cache = TTLCache(maxsize=64, ttl=300)
+        # (ETag, raw body) of GET responses, for conditional requests
+        self._etags = TTLCache(maxsize=256, ttl=3600)
+        self._headers = {
+            "X-API-Key": api_key,
+            "Content-Type": "application/json",
+        }
+        self._owns_client = http_client is None
+        self._client = http_client or create_http_client(timeout=timeout)
 
     @classmethod
-    def from_env(cls) -> "ComposioClient":
-        """Create client from environment variables or AWS Secrets Manager."""
+    def from_env(cls, **kwargs: Any) -> "ComposioClient":
+        """Create client from environment variables or AWS Secrets Manager.
+
+        Args:
+            **kwargs: Passed through to the constructor (e.g. http_client)
+        """
         api_key = _load_api_key()
         if not api_key:
             raise ValueError(
                 "Missing COMPOSIO_API_KEY. Set env var or store in "
                 "AWS Secrets Manager at composio/api-key"
             )
-        return cls(api_key=api_key)
+        return cls(api_key=api_key, **kwargs)
+
+    async def _send(
+        self, method: str, path: str, params: Optional[dict] = None, body: Optional[dict] = None
+    ) -> httpx.Response:
+        """Make an API request and return the successful response."""
+        url = f"{self.BASE_URL}{path}"
+        response = await _send_with_retry(lambda: self._client.request(
+            method,
+            url,
+            params=params,
+            content=None if body is None else _json.dumps(body),
+            headers=self._headers,
+        ), idempotent=method == "GET")
+        response.raise_for_status()
+        return response
+
+    async def _get(
+        self, path: str, params: Optional[dict], decode: Callable[[bytes], Any]
+    ) -> Any:
+        """GET path and return decode(body), revalidating earlier results by ETag.
+
+        When a previous response carried an ETag it is sent as If-None-Match;
+        a 304 reply decodes the stored body again, so every caller gets its
+        own objects and none can alter what later reads see.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._etags.get(key)
+        headers = self._headers
+        if cached is not _MISSING:
+            headers = {**headers, "If-None-Match": cached[0]}
+        response = await _send_with_retry(lambda: self._client.get(
+            f"{self.BASE_URL}{path}", params=params, headers=headers
+        ))
+        if response.status_code == 304 and cached is not _MISSING:
+            return decode(cached[1])
+        response.raise_for_status()
+        if response.status_code == 204:
+            return {}
+        content = response.content
+        etag = response.headers.get("etag")
+        if etag:
+            self._etags.set(key, (etag, content))
+        return decode(content)
 
     async def _request(
         self, method: str, path: str, params: Optional[dict] = None, body: Optional[dict] = None
     ) -> Any:
         """Make an API request."""
-        url = f"{self.BASE_URL}{path}"
-        response = await self._client.request(method, url, params=params, json=body)
-        response.raise_for_status()
+        if method == "GET":
+            return await self._get(path, params, _json.loads)
+        response = await self._send(method, path, params, body)
         if response.status_code == 204:
             return {}
-        return response.json()
+        return _json.loads(response.content)
+
+    async def _iter_pages(
+        self, path: str, params: dict, adapter: TypeAdapter
+    ) -> AsyncIterator[list[Any]]:
+        """Yield the parsed items of each page of a v3 list endpoint, in order.
+
+        Each page body is decoded by adapter (see _page_adapter) directly into
+        models. v3 responses carry ``next_cursor`` and ``total_pages``. When
+        the cursor looks like a page number, page 2 is fetched normally and
+        its next_cursor checked to be the following number; only then are the
+        remaining pages fetched concurrently (bounded by max_concurrency)
+        while earlier pages are consumed. Otherwise cursors are followed one
+        page at a time.
+        """
+
+        async def fetch(page_params: dict) -> Any:
+            return await self._get(path, page_params, adapter.validate_json)
+
+        page = await fetch(params)
+        if isinstance(page, list):
+            yield page
+            return
+        yield page.items
+
+        cursor = page.next_cursor
+        total_pages = page.total_pages
+        if cursor and total_pages and str(cursor).isdigit():
+            page = await fetch({**params, "cursor": cursor})
+            if isinstance(page, list):
+                yield page
+                return
+            yield page.items
+            number = int(cursor) + 1
+            if str(page.next_cursor) == str(number) and number <= int(total_pages):
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+
+                async def fetch_page(n: int) -> Any:
+                    async with semaphore:
+                        return await fetch({**params, "cursor": n})
+
+                tasks = [
+                    asyncio.ensure_future(fetch_page(n))
+                    for n in range(number, int(total_pages) + 1)
+                ]
+                try:
+                    for task in tasks:
+                        page = await task
+                        yield page if isinstance(page, list) else page.items
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    # Retrieve the cancelled tasks' outcomes so none is left
+                    # unobserved
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                return
+            cursor = page.next_cursor
+
+        while cursor:
+            page = await fetch({**params, "cursor": cursor})
+            if isinstance(page, list):
+                yield page
+                return
+            yield page.items
+            cursor = page.next_cursor
 
     async def close(self):
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self):
         return self
@@ -183,75 +491,54 @@ class ComposioClient:
 
     # ============== TOOLKITS ==============
 
+    async def iter_toolkits(self, search: Optional[str] = None) -> AsyncIterator[Toolkit]:
+        """Yield available toolkits (apps) page by page."""
+        params = {"search": search} if search else {}
+        async for items in self._iter_pages("/toolkits", params, _TOOLKIT_PAGE_ADAPTER):
+            for t in items:
+                yield t
+
+    @cached
     async def list_toolkits(self, search: Optional[str] = None) -> list[Toolkit]:
-        """List available toolkits (apps)."""
-        params = {}
-        if search:
-            params["search"] = search
-        data = await self._request("GET", "/toolkits", params=params)
-        items = data if isinstance(data, list) else data.get("items", data.get("toolkits", []))
-        return [
-            Toolkit(
-                slug=t.get("slug", t.get("key", "")),
-                name=t.get("name", t.get("display_name", "")),
-                description=t.get("description"),
-                logo=t.get("logo"),
-                auth_schemes=t.get("auth_schemes", []),
-                categories=t.get("categories", []),
-            )
-            for t in items
-        ]
+        """List available toolkits (apps) across all pages."""
+        return [t async for t in self.iter_toolkits(search)]
 
+    @cached
     async def get_toolkit_tools(self, toolkit_slug: str) -> list[ToolkitTool]:
         """List tools/actions available for a toolkit."""
         # v3 toolkit tools endpoint doesn't exist; use v2 actions with apps filter
         url = "https://backend.composio.dev/api/v2/actions"
-        response = await self._client.get(url, params={"apps": toolkit_slug, "limit": 100})
+        response = await _send_with_retry(lambda: self._client.get(
+            url, params={"apps": toolkit_slug, "limit": 100}, headers=self._headers
+        ))
         response.raise_for_status()
-        data = response.json()
+        data = _json.loads(response.content)
         items = data if isinstance(data, list) else data.get("items", data.get("tools", []))
-        return [
-            ToolkitTool(
-                action=t.get("name", t.get("action", "")),
-                display_name=t.get("display_name", t.get("displayName")),
-                description=t.get("description"),
-                parameters=t.get("parameters"),
-            )
-            for t in items
-        ]
+        return [ToolkitTool.model_validate(t) for t in items]
 
     # ============== AUTH CONFIGS ==============
 
+    async def iter_auth_configs(
+        self, toolkit_slug: Optional[str] = None
+    ) -> AsyncIterator[AuthConfig]:
+        """Yield auth configs page by page."""
+        params = {"toolkit_slug": toolkit_slug} if toolkit_slug else {}
+        async for items in self._iter_pages("/auth_configs", params, _AUTH_CONFIG_PAGE_ADAPTER):
+            for c in items:
+                yield c
+
     async def list_auth_configs(self, toolkit_slug: Optional[str] = None) -> list[AuthConfig]:
-        """List auth configs."""
-        params = {}
-        if toolkit_slug:
-            params["toolkit_slug"] = toolkit_slug
-        data = await self._request("GET", "/auth_configs", params=params)
-        items = data if isinstance(data, list) else data.get("items", data.get("auth_configs", []))
-        return [
-            AuthConfig(
-                id=c.get("id", ""),
-                toolkit_slug=c.get("toolkit_slug", c.get("app_name")),
-                auth_scheme=c.get("auth_scheme"),
-                name=c.get("name"),
-                created_at=c.get("created_at"),
-                expected_input_fields=c.get("expected_input_fields", []),
-            )
-            for c in items
-        ]
+        """List auth configs across all pages."""
+        return [c async for c in self.iter_auth_configs(toolkit_slug)]
 
     async def get_auth_config(self, auth_config_id: str) -> AuthConfig:
         """Get auth config details."""
         c = await self._request("GET", f"/auth_configs/{auth_config_id}")
-        return AuthConfig(
-            id=c.get("id", auth_config_id),
-            toolkit_slug=c.get("toolkit_slug", c.get("app_name")),
-            auth_scheme=c.get("auth_scheme"),
-            name=c.get("name"),
-            created_at=c.get("created_at"),
-            expected_input_fields=c.get("expected_input_fields", []),
-        )
+        return self._parse_auth_config(c, auth_config_id)
+
+    def _parse_auth_config(self, c: dict, fallback_id: str = "") -> AuthConfig:
+        """Parse a raw auth config into an AuthConfig model."""
+        return AuthConfig.model_validate({"id": fallback_id, **c} if fallback_id else c)
 
     async def create_auth_config(
         self,
@@ -291,14 +578,12 @@ class ComposioClient:
         data = await self._request("POST", "/auth_configs", body=body)
         # Response nests config under "auth_config" key
         c = data.get("auth_config", data)
-        return AuthConfig(
-            id=c.get("id", ""),
-            toolkit_slug=data.get("toolkit", {}).get("slug", toolkit_slug) if isinstance(data.get("toolkit"), dict) else c.get("toolkit_slug", toolkit_slug),
-            auth_scheme=c.get("auth_scheme", auth_scheme),
-            name=c.get("name", name),
-            created_at=c.get("created_at"),
-            expected_input_fields=c.get("expected_input_fields", []),
-        )
+        # Fall back to the request's values for fields the response omits
+        fields = {"toolkit_slug": toolkit_slug, "auth_scheme": auth_scheme, "name": name, **c}
+        toolkit = data.get("toolkit")
+        if isinstance(toolkit, dict):
+            fields["toolkit_slug"] = toolkit.get("slug", toolkit_slug)
+        return AuthConfig.model_validate(fields)
 
     async def delete_auth_config(self, auth_config_id: str) -> dict:
         """Delete an auth config."""
@@ -306,55 +591,47 @@ class ComposioClient:
 
     # ============== CONNECTED ACCOUNTS ==============
 
+    async def iter_connections(
+        self,
+        toolkit_slug: Optional[str] = None,
+        status: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[ConnectedAccount]:
+        """Yield connected accounts page by page. Filters as for list_connections."""
+        filters = (("toolkit_slug", toolkit_slug), ("status", status), ("user_id", user_id))
+        params = {k: v for k, v in filters if v}
+        async for items in self._iter_pages(
+            "/connected_accounts", params, _CONNECTION_PAGE_ADAPTER
+        ):
+            for a in items:
+                if a.deprecated_uuid:
+                    # Saves execute_action a lookup for accounts listed here
+                    self._uuids.set(a.id, a.deprecated_uuid)
+                yield a
+
     async def list_connections(
         self,
         toolkit_slug: Optional[str] = None,
         status: Optional[str] = None,
         user_id: Optional[str] = None,
     ) -> list[ConnectedAccount]:
-        """List connected accounts.
+        """List connected accounts across all pages.
 
         Args:
             toolkit_slug: Filter by app (e.g., 'instagram')
             status: Filter by status - 'ACTIVE', 'INACTIVE', 'PENDING', 'EXPIRED', 'FAILED'
             user_id: Filter by user ID
         """
-        params = {}
-        if toolkit_slug:
-            params["toolkit_slug"] = toolkit_slug
-        if status:
-            params["status"] = status
-        if user_id:
-            params["user_id"] = user_id
-        data = await self._request("GET", "/connected_accounts", params=params)
-        items = data if isinstance(data, list) else data.get("items", data.get("connected_accounts", []))
-        return [
-            ConnectedAccount(
-                id=a.get("id", ""),
-                status=a.get("status", "UNKNOWN"),
-                toolkit_slug=(a.get("toolkit", {}).get("slug") if isinstance(a.get("toolkit"), dict) else None) or a.get("toolkit_slug", a.get("app_name")),
-                auth_config_id=(a.get("auth_config", {}).get("id") if isinstance(a.get("auth_config"), dict) else None) or a.get("auth_config_id"),
-                user_id=a.get("user_id", a.get("entity_id")),
-                created_at=a.get("created_at"),
-                updated_at=a.get("updated_at"),
-                deprecated_uuid=(a.get("deprecated", {}).get("uuid") if isinstance(a.get("deprecated"), dict) else None),
-            )
-            for a in items
-        ]
+        return [a async for a in self.iter_connections(toolkit_slug, status, user_id)]
 
     async def get_connection(self, connection_id: str) -> ConnectedAccount:
         """Get a connected account by ID."""
         a = await self._request("GET", f"/connected_accounts/{connection_id}")
-        return ConnectedAccount(
-            id=a.get("id", connection_id),
-            status=a.get("status", "UNKNOWN"),
-            toolkit_slug=(a.get("toolkit", {}).get("slug") if isinstance(a.get("toolkit"), dict) else None) or a.get("toolkit_slug", a.get("app_name")),
-            auth_config_id=(a.get("auth_config", {}).get("id") if isinstance(a.get("auth_config"), dict) else None) or a.get("auth_config_id"),
-            user_id=a.get("user_id", a.get("entity_id")),
-            created_at=a.get("created_at"),
-            updated_at=a.get("updated_at"),
-            deprecated_uuid=(a.get("deprecated", {}).get("uuid") if isinstance(a.get("deprecated"), dict) else None),
-        )
+        return self._parse_connection(a, connection_id)
+
+    def _parse_connection(self, a: dict, fallback_id: str = "") -> ConnectedAccount:
+        """Parse a raw connected account into a ConnectedAccount model."""
+        return ConnectedAccount.model_validate({"id": fallback_id, **a} if fallback_id else a)
 
     async def initiate_connection(
         self,
@@ -385,11 +662,10 @@ class ComposioClient:
         }
 
         data = await self._request("POST", "/connected_accounts", body=body)
-        return ConnectionRequest(
-            id=data.get("id", data.get("connectedAccountId", "")),
-            status=data.get("status", "INITIATED"),
-            redirect_url=data.get("redirect_url", data.get("redirectUrl")),
-        )
+        request = ConnectionRequest.model_validate({"status": "INITIATED", **data})
+        if not request.id:
+            raise ValueError(f"No connected account ID in response: {data}")
+        return request
 
     async def initiate_connection_link(
         self,
@@ -399,6 +675,9 @@ class ComposioClient:
     ) -> ConnectionRequest:
         """Create a Composio-hosted auth link for the user.
 
+        The link is identified by the result's link_token; id is the
+        connected account, when the response names one.
+
         Args:
             auth_config_id: The auth config to use
             user_id: User identifier
@@ -414,55 +693,64 @@ class ComposioClient:
         }
 
         data = await self._request("POST", "/connected_accounts/link", body=body)
-        return ConnectionRequest(
-            id=data.get("id", data.get("link_token", "")),
-            status=data.get("status", "INITIATED"),
-            redirect_url=data.get("redirect_url", data.get("redirectUrl")),
-        )
+        return ConnectionRequest.model_validate({"status": "INITIATED", **data})
 
     async def delete_connection(self, connection_id: str) -> dict:
         """Delete a connected account."""
         return await self._request("DELETE", f"/connected_accounts/{connection_id}")
 
     async def refresh_connection(self, connection_id: str) -> ConnectedAccount:
-        """Refresh authentication for a connected account."""
+        """Refresh authentication for a connected account.
+
+        Concurrent refreshes of the same account share one in-flight request,
+        so a burst of callers hitting an expired token triggers a single
+        refresh round-trip.
+        """
+        future = self._refreshes.get(connection_id)
+        if future is None:
+            future = asyncio.ensure_future(self._refresh_connection(connection_id))
+            self._refreshes[connection_id] = future
+            future.add_done_callback(lambda _: self._refreshes.pop(connection_id, None))
+        # Shield so one caller being cancelled doesn't cancel the shared refresh
+        return await asyncio.shield(future)
+
+    async def _refresh_connection(self, connection_id: str) -> ConnectedAccount:
         a = await self._request("POST", f"/connected_accounts/{connection_id}/refresh")
-        return ConnectedAccount(
-            id=a.get("id", connection_id),
-            status=a.get("status", "UNKNOWN"),
-            toolkit_slug=a.get("toolkit_slug", a.get("app_name")),
-            auth_config_id=a.get("auth_config_id"),
-            user_id=a.get("user_id"),
-            created_at=a.get("created_at"),
-            updated_at=a.get("updated_at"),
-        )
+        return self._parse_connection(a, connection_id)
 
     # ============== ACTIONS ==============
 
     async def execute_action(
         self,
         action: str,
-        connected_account_id: str,
+        connected_account_id: Union[str, ConnectedAccount],
         params: Optional[dict] = None,
     ) -> dict:
         """Execute a Composio action on a connected account.
 
         Args:
             action: The action name (e.g., 'INSTAGRAM_CREATE_MEDIA_CONTAINER')
-            connected_account_id: The connected account ID (v3 ca_* or deprecated UUID)
+            connected_account_id: The connected account ID (v3 ca_* or deprecated
+                UUID), or a ConnectedAccount from list_connections/get_connection,
+                whose deprecated_uuid is used without another lookup
             params: Action input parameters
         """
+        if isinstance(connected_account_id, ConnectedAccount):
+            account = connected_account_id
+            connected_account_id = account.deprecated_uuid or account.id
         # v2 execute requires deprecated UUIDs, not v3 ca_* IDs
         account_id = connected_account_id
         if connected_account_id.startswith("ca_"):
-            conn = await self.get_connection(connected_account_id)
-            if conn.deprecated_uuid:
+            account_id = self._uuids.get(connected_account_id)
+            if account_id is _MISSING:
+                conn = await self.get_connection(connected_account_id)
+                if not conn.deprecated_uuid:
+                    raise ValueError(
+                        f"Cannot resolve v3 ID {connected_account_id} to a UUID for v2 execute. "
+                        "Pass the deprecated UUID directly."
+                    )
                 account_id = conn.deprecated_uuid
-            else:
-                raise ValueError(
-                    f"Cannot resolve v3 ID {connected_account_id} to a UUID for v2 execute. "
-                    "Pass the deprecated UUID directly."
-                )
+                self._uuids.set(connected_account_id, account_id)
 
         body: dict[str, Any] = {
             "connectedAccountId": account_id,
@@ -470,9 +758,10 @@ class ComposioClient:
         }
         # Actions use v2 endpoint
         url = "https://backend.composio.dev/api/v2/actions"
-        response = await self._client.post(
+        response = await _send_with_retry(lambda: self._client.post(
             f"{url}/{action}/execute",
-            json=body,
-        )
+            content=_json.dumps(body),
+            headers=self._headers,
+        ), idempotent=False)
         response.raise_for_status()
-        return response.json()
+        return _json.loads(response.content)
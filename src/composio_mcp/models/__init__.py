@@ -5,7 +5,7 @@ Management models are defined here. Domain models are in submodules.
 
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field
 
 # Re-export domain models for convenience
 from .notion import (
@@ -32,11 +32,17 @@ from .zoom import (
 
 # ============== MANAGEMENT MODELS ==============
 
+# Models returned by list endpoints declare validation aliases for the
+# API's alternate and nested key names, so raw items parse with a single
+# model_validate call.
+
 
 class Toolkit(BaseModel):
     """A Composio toolkit (app integration)."""
-    slug: str
-    name: str
+    model_config = ConfigDict(populate_by_name=True)
+
+    slug: str = Field("", validation_alias=AliasChoices("slug", "key"))
+    name: str = Field("", validation_alias=AliasChoices("name", "display_name"))
     description: Optional[str] = None
     logo: Optional[str] = None
     auth_schemes: list[str] = Field(default_factory=list)
@@ -45,16 +51,24 @@ class Toolkit(BaseModel):
 
 class ToolkitTool(BaseModel):
     """A tool/action within a toolkit."""
-    action: str
-    display_name: Optional[str] = None
+    model_config = ConfigDict(populate_by_name=True)
+
+    action: str = Field("", validation_alias=AliasChoices("name", "action"))
+    display_name: Optional[str] = Field(
+        None, validation_alias=AliasChoices("display_name", "displayName")
+    )
     description: Optional[str] = None
     parameters: Optional[dict[str, Any]] = None
 
 
 class AuthConfig(BaseModel):
     """An auth config (blueprint for connecting an app)."""
-    id: str
-    toolkit_slug: Optional[str] = None
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = ""
+    toolkit_slug: Optional[str] = Field(
+        None, validation_alias=AliasChoices("toolkit_slug", "app_name")
+    )
     auth_scheme: Optional[str] = None
     name: Optional[str] = None
     created_at: Optional[str] = None
@@ -63,21 +77,41 @@ class AuthConfig(BaseModel):
 
 class ConnectedAccount(BaseModel):
     """A connected account."""
-    id: str
-    status: str
-    toolkit_slug: Optional[str] = None
-    auth_config_id: Optional[str] = None
-    user_id: Optional[str] = None
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = ""
+    status: str = "UNKNOWN"
+    toolkit_slug: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices(
+            AliasPath("toolkit", "slug"), "toolkit_slug", "app_name"
+        ),
+    )
+    auth_config_id: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices(AliasPath("auth_config", "id"), "auth_config_id"),
+    )
+    user_id: Optional[str] = Field(None, validation_alias=AliasChoices("user_id", "entity_id"))
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
-    deprecated_uuid: Optional[str] = None
+    deprecated_uuid: Optional[str] = Field(
+        None, validation_alias=AliasChoices(AliasPath("deprecated", "uuid"), "deprecated_uuid")
+    )
 
 
 class ConnectionRequest(BaseModel):
     """Result of initiating a connection."""
-    id: str
+    model_config = ConfigDict(populate_by_name=True)
+
+    # Connected account ID; a hosted link response may only carry its link token
+    id: Optional[str] = Field(
+        None, validation_alias=AliasChoices("id", "connected_account_id", "connectedAccountId")
+    )
     status: str
-    redirect_url: Optional[str] = None
+    redirect_url: Optional[str] = Field(
+        None, validation_alias=AliasChoices("redirect_url", "redirectUrl")
+    )
+    link_token: Optional[str] = None
 
 
 __all__ = [
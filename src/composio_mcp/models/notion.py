@@ -3,9 +3,14 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
+# Models the clients return are frozen: cached reads (see _cache) hand the
+# same instance to every caller, so fields can't be reassigned. The freeze
+# is shallow; dict and list fields (properties, content, ...) are shared
+# too and must be treated as read-only.
+
 # ============== PAGES ==============
 
 class PageProperty(BaseModel):
@@ -17,6 +22,8 @@ class PageProperty(BaseModel):
 
 class Page(BaseModel):
     """Notion page."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     url: Optional[str] = None
     title: Optional[str] = None
@@ -40,6 +47,8 @@ class BlockContent(BaseModel):
 
 class Block(BaseModel):
     """Notion block."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: str
     has_children: bool = False
@@ -54,6 +63,8 @@ class Block(BaseModel):
 
 class Database(BaseModel):
     """Notion database."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: Optional[str] = None
     description: Optional[str] = None
@@ -68,6 +79,8 @@ class Database(BaseModel):
 
 class DatabaseRow(BaseModel):
     """A row (page) in a Notion database."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     url: Optional[str] = None
     properties: dict[str, Any] = Field(default_factory=dict)
@@ -89,6 +102,8 @@ class DatabaseQuery(BaseModel):
 
 class Comment(BaseModel):
     """Notion comment."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     discussion_id: Optional[str] = None
     parent_id: Optional[str] = None
@@ -101,6 +116,8 @@ class Comment(BaseModel):
 
 class User(BaseModel):
     """Notion user."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: Optional[str] = None
     name: Optional[str] = None
@@ -112,6 +129,8 @@ class User(BaseModel):
 
 class SearchResult(BaseModel):
     """Workspace search result."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     object_type: str  # 'page' or 'database'
     title: Optional[str] = None
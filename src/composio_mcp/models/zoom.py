@@ -3,11 +3,18 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 
+# Models the clients return are frozen: cached reads (see _cache) hand the
+# same instance to every caller, so fields can't be reassigned. The freeze
+# is shallow; dict and list fields (properties, content, ...) are shared
+# too and must be treated as read-only.
+
 class Meeting(BaseModel):
     """Zoom meeting."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     topic: str
     start_time: datetime
@@ -43,9 +50,11 @@ class Registrant(BaseModel):
 
 class RecordingFile(BaseModel):
     """Recording file."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     file_type: str
-    file_size: int
+    file_size: int = 0
     download_url: Optional[str] = None
     play_url: Optional[str] = None
     status: Optional[str] = None
@@ -53,6 +62,8 @@ class RecordingFile(BaseModel):
 
 class Recording(BaseModel):
     """Meeting recording."""
+    model_config = ConfigDict(frozen=True)
+
     meeting_id: int
     topic: str
     start_time: datetime
@@ -64,8 +75,11 @@ class Recording(BaseModel):
 
 class Participant(BaseModel):
     """Meeting participant."""
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     name: Optional[str] = None
-    email: Optional[str] = None
+    # Zoom reports the address as user_email
+    email: Optional[str] = Field(None, validation_alias=AliasChoices("user_email", "email"))
     join_time: Optional[datetime] = None
     leave_time: Optional[datetime] = None
     duration: Optional[int] = None
@@ -73,6 +87,8 @@ class Participant(BaseModel):
 
 class MeetingSummary(BaseModel):
     """AI-generated meeting summary."""
+    model_config = ConfigDict(frozen=True)
+
     meeting_id: int
     summary: Optional[str] = None
     next_steps: Optional[list[str]] = None
@@ -8,8 +8,9 @@ Usage:
         user = await notion.get_current_user()
 """
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
+from ._cache import cached, invalidates, single_flight
 from .client import _BaseClient
 from .models.notion import (
     Block,
@@ -21,16 +22,77 @@ from .models.notion import (
     User,
 )
 
+# Shared read-only default for missing sub-objects in the parsers, so a
+# miss doesn't allocate a fresh {}. Never mutated; models copy dict fields.
+_EMPTY: dict = {}
+
+
+class BlockAppendError(Exception):
+    """A batched block append failed after some chunks were appended.
+
+    Attributes:
+        appended: Blocks appended before the failure; resend blocks[appended:]
+            to resume without duplicating content
+        result: Merged response of the chunks that succeeded
+    """
+
+    def __init__(self, appended: int, total: int, result: dict):
+        super().__init__(
+            f"Appended {appended} of {total} blocks before a request failed; "
+            f"resend the remaining {total - appended} to finish"
+        )
+        self.appended = appended
+        self.result = result
+
+
+def _join_plain(rich_text: Any) -> Optional[str]:
+    """Concatenate the plain_text of a rich-text array (None if empty)."""
+    if not rich_text or not isinstance(rich_text, list):
+        return None
+    return "".join([t.get("plain_text", "") for t in rich_text])
+
 
 class NotionClient(_BaseClient):
     """Notion client using Composio as the OAuth/API layer."""
 
+    # Notion averages 3 requests/second per integration
+    RATE_LIMIT = 3.0
+    # Most children Notion accepts in one append request
+    MAX_APPEND_BLOCKS = 100
+
     @classmethod
-    def from_env(cls) -> "NotionClient":
-        return cls._from_env("notion_connected_account_id", "NOTION_CONNECTED_ACCOUNT_ID")
+    def from_env(cls, **kwargs: Any) -> "NotionClient":
+        return cls._from_env("notion_connected_account_id", "NOTION_CONNECTED_ACCOUNT_ID", **kwargs)
+
+    async def _execute_list(self, action: str, params: dict) -> tuple[list[dict], Optional[str]]:
+        """Execute a list action and return its raw items and next_cursor.
+
+        Items are a bare list response, its "results", or the response
+        itself when it is a single object. Non-object entries are dropped
+        here so parsers can take every item as a dict. List actions are
+        reads, so they are retried on transient gateway errors.
+        """
+        data = await self._execute(action, params, idempotent=True)
+        if isinstance(data, list):
+            return [r for r in data if isinstance(r, dict)], None
+        results = data.get("results")
+        if results is None:
+            return [data], data.get("next_cursor")
+        return [r for r in results if isinstance(r, dict)], data.get("next_cursor")
+
+    async def _iter_cursor(self, action: str, params: dict) -> AsyncIterator[dict]:
+        """Yield raw results of a paginated action until next_cursor runs out."""
+        while True:
+            results, cursor = await self._execute_list(action, params)
+            for r in results:
+                yield r
+            if not cursor:
+                return
+            params = {**params, "start_cursor": cursor}
 
     # ============== PAGES ==============
 
+    @invalidates
     async def create_page(
         self,
         parent_id: str,
@@ -52,22 +114,25 @@ class NotionClient(_BaseClient):
             "parent_type": parent_type,
             "parent_id": parent_id,
             "title": title,
+            **{k: v for k, v in (("icon", icon), ("cover", cover)) if v},
         }
-        if icon:
-            params["icon"] = icon
-        if cover:
-            params["cover"] = cover
 
         data = await self._execute("NOTION_CREATE_NOTION_PAGE", params)
         return self._parse_page(data)
 
+    @cached
     async def get_page(self, page_id: str) -> Page:
         """Get page metadata."""
         data = await self._execute("NOTION_FETCH_BLOCK_METADATA", {
             "block_id": page_id,
-        })
+        }, idempotent=True)
         return self._parse_page(data)
 
+    async def get_pages(self, page_ids: list[str]) -> list[Page]:
+        """Get metadata for several pages concurrently, in the order given."""
+        return await self._gather(self.get_page(p) for p in page_ids)
+
+    @invalidates
     async def update_page(
         self,
         page_id: str,
@@ -78,21 +143,22 @@ class NotionClient(_BaseClient):
         properties: Optional[dict] = None,
     ) -> Page:
         """Update page properties."""
-        params: dict[str, Any] = {"page_id": page_id}
-        if title is not None:
-            params["title"] = title
-        if icon is not None:
-            params["icon"] = icon
-        if cover is not None:
-            params["cover"] = cover
-        if archived is not None:
-            params["archived"] = archived
-        if properties is not None:
-            params["properties"] = properties
+        updates = (
+            ("title", title),
+            ("icon", icon),
+            ("cover", cover),
+            ("archived", archived),
+            ("properties", properties),
+        )
+        params: dict[str, Any] = {
+            "page_id": page_id,
+            **{k: v for k, v in updates if v is not None},
+        }
 
         data = await self._execute("NOTION_UPDATE_PAGE", params)
         return self._parse_page(data)
 
+    @invalidates
     async def archive_page(self, page_id: str, archived: bool = True) -> Page:
         """Archive or unarchive a page."""
         data = await self._execute("NOTION_ARCHIVE_NOTION_PAGE", {
@@ -101,6 +167,7 @@ class NotionClient(_BaseClient):
         })
         return self._parse_page(data)
 
+    @invalidates
     async def duplicate_page(self, page_id: str) -> Page:
         """Duplicate a page with all its content."""
         data = await self._execute("NOTION_DUPLICATE_PAGE", {
@@ -108,42 +175,53 @@ class NotionClient(_BaseClient):
         })
         return self._parse_page(data)
 
+    @single_flight
     async def search_pages(self, query: str = "") -> list[Page]:
         """Search pages by title. Empty query lists all accessible pages."""
-        data = await self._execute("NOTION_SEARCH_NOTION_PAGE", {
+        results, _ = await self._execute_list("NOTION_SEARCH_NOTION_PAGE", {
             "query": query,
         })
-        results = data if isinstance(data, list) else data.get("results", [data])
-        return [self._parse_page(r) for r in results if isinstance(r, dict)]
-
+        parse = self._parse_page
+        return [parse(r) for r in results]
+
+    async def iter_search_pages(
+        self, query: str = "", page_size: int = 100
+    ) -> AsyncIterator[Page]:
+        """Yield every page matching a title search, following Notion's cursor."""
+        params = {"query": query, "page_size": page_size}
+        async for r in self._iter_cursor("NOTION_SEARCH_NOTION_PAGE", params):
+            yield self._parse_page(r)
+
+    @cached
     async def get_page_property(self, page_id: str, property_id: str) -> dict:
         """Get a specific page property."""
         return await self._execute("NOTION_GET_PAGE_PROPERTY_ACTION", {
             "page_id": page_id,
             "property_id": property_id,
-        })
+        }, idempotent=True)
 
     def _parse_page(self, data: dict) -> Page:
         """Parse raw API response into a Page model."""
         title = None
-        props = data.get("properties", {})
+        props = data.get("properties") or _EMPTY
         for prop in props.values():
             if isinstance(prop, dict) and prop.get("type") == "title":
-                title_arr = prop.get("title", [])
-                if title_arr and isinstance(title_arr, list):
-                    title = "".join(t.get("plain_text", "") for t in title_arr)
+                title = _join_plain(prop.get("title"))
                 break
 
-        parent = data.get("parent", {})
+        parent = data.get("parent") or _EMPTY
         parent_type = parent.get("type")
         parent_id = parent.get(parent_type) if parent_type else None
+        icon = data.get("icon")
+        cover = data.get("cover")
+        external = cover.get("external") if isinstance(cover, dict) else None
 
         return Page(
             id=data.get("id", ""),
             url=data.get("url"),
             title=title,
-            icon=data.get("icon", {}).get("emoji") if isinstance(data.get("icon"), dict) else None,
-            cover=data.get("cover", {}).get("external", {}).get("url") if isinstance(data.get("cover"), dict) else None,
+            icon=icon.get("emoji") if isinstance(icon, dict) else None,
+            cover=external.get("url") if isinstance(external, dict) else None,
             parent_id=parent_id,
             parent_type=parent_type,
             archived=data.get("archived", False),
@@ -154,6 +232,7 @@ class NotionClient(_BaseClient):
 
     # ============== BLOCKS ==============
 
+    @invalidates
     async def add_content_blocks(self, page_id: str, blocks: list[dict]) -> dict:
         """Add multiple content blocks to a page (user-friendly format).
 
@@ -161,25 +240,59 @@ class NotionClient(_BaseClient):
             page_id: The page ID
             blocks: List of block dicts, e.g. [{"type": "paragraph", "text": "Hello"}]
         """
-        return await self._execute("NOTION_ADD_MULTIPLE_PAGE_CONTENT", {
-            "page_id": page_id,
-            "blocks": blocks,
-        })
+        return await self._append_batched(
+            "NOTION_ADD_MULTIPLE_PAGE_CONTENT", {"page_id": page_id}, "blocks", blocks
+        )
 
+    @invalidates
     async def append_complex_blocks(self, block_id: str, children: list[dict]) -> dict:
         """Append complex blocks with full Notion block structure."""
-        return await self._execute("NOTION_APPEND_BLOCK_CHILDREN", {
-            "block_id": block_id,
-            "children": children,
-        })
+        return await self._append_batched(
+            "NOTION_APPEND_BLOCK_CHILDREN", {"block_id": block_id}, "children", children
+        )
 
+    async def _append_batched(
+        self, action: str, params: dict, key: str, blocks: list[dict]
+    ) -> dict:
+        """Append blocks in chunks of at most MAX_APPEND_BLOCKS.
+
+        Notion rejects appends of more than 100 children, so longer lists are
+        sent as consecutive requests. They run one after another because
+        Notion appends in arrival order. The result is the last response
+        with every chunk's "results" concatenated.
+
+        Raises:
+            BlockAppendError: A chunk failed after earlier ones were appended
+                (the original error if nothing was appended)
+        """
+        n = self.MAX_APPEND_BLOCKS
+        merged: list = []
+        last: dict = {}
+        for i in range(0, len(blocks), n):
+            try:
+                data = await self._execute(action, {**params, key: blocks[i:i + n]})
+            except Exception as e:
+                if not i:
+                    raise
+                raise BlockAppendError(i, len(blocks), {**last, "results": merged}) from e
+            if isinstance(data, list):
+                merged.extend(data)
+            elif isinstance(data, dict):
+                last = data
+                results = data.get("results")
+                if isinstance(results, list):
+                    merged.extend(results)
+        return {**last, "results": merged}
+
+    @cached
     async def get_block(self, block_id: str) -> Block:
         """Get block metadata."""
         data = await self._execute("NOTION_FETCH_BLOCK_METADATA", {
             "block_id": block_id,
-        })
+        }, idempotent=True)
         return self._parse_block(data)
 
+    @cached
     async def get_block_children(
         self,
         block_id: str,
@@ -191,25 +304,41 @@ class NotionClient(_BaseClient):
         if start_cursor:
             params["start_cursor"] = start_cursor
 
-        data = await self._execute("NOTION_FETCH_BLOCK_CONTENTS", params)
-        results = data if isinstance(data, list) else data.get("results", [data])
-        return [self._parse_block(b) for b in results if isinstance(b, dict)]
+        results, _ = await self._execute_list("NOTION_FETCH_BLOCK_CONTENTS", params)
+        parse = self._parse_block
+        return [parse(b) for b in results]
 
+    async def iter_block_children(
+        self, block_id: str, page_size: int = 100
+    ) -> AsyncIterator[Block]:
+        """Yield every child block of a block or page, following Notion's cursor."""
+        params = {"block_id": block_id, "page_size": page_size}
+        async for b in self._iter_cursor("NOTION_FETCH_BLOCK_CONTENTS", params):
+            yield self._parse_block(b)
+
+    @invalidates
     async def update_block(self, block_id: str, **kwargs) -> Block:
         """Update a block's content."""
         params = {"block_id": block_id, **kwargs}
         data = await self._execute("NOTION_UPDATE_BLOCK", params)
         return self._parse_block(data)
 
+    @invalidates
     async def delete_block(self, block_id: str) -> dict:
         """Delete (archive) a block."""
-        return await self._execute("NOTION_DELETE_BLOCK", {
+        data = await self._execute("NOTION_DELETE_BLOCK", {
             "block_id": block_id,
         })
+        # The raw response has no parent_id for @invalidates to pick up
+        parent_id = self._parse_block(data).parent_id if isinstance(data, dict) else None
+        if parent_id:
+            self.invalidate_cache(parent_id)
+        return data
 
     def _parse_block(self, data: dict) -> Block:
         """Parse raw API response into a Block model."""
         block_type = data.get("type", "unknown")
+        parent = data.get("parent") or _EMPTY
         return Block(
             id=data.get("id", ""),
             type=block_type,
@@ -217,12 +346,13 @@ class NotionClient(_BaseClient):
             archived=data.get("archived", False),
             created_time=data.get("created_time"),
             last_edited_time=data.get("last_edited_time"),
-            parent_id=data.get("parent", {}).get(data.get("parent", {}).get("type", "")),
+            parent_id=parent.get(parent.get("type", "")),
             content=data.get(block_type),
         )
 
     # ============== DATABASES ==============
 
+    @invalidates
     async def create_database(
         self,
         parent_id: str,
@@ -237,11 +367,12 @@ class NotionClient(_BaseClient):
         })
         return self._parse_database(data)
 
+    @cached
     async def get_database(self, database_id: str) -> Database:
         """Get database metadata."""
         data = await self._execute("NOTION_FETCH_DATABASE", {
             "database_id": database_id,
-        })
+        }, idempotent=True)
         return self._parse_database(data)
 
     async def query_database(
@@ -253,6 +384,52 @@ class NotionClient(_BaseClient):
         start_cursor: Optional[str] = None,
     ) -> list[DatabaseRow]:
         """Query a database for rows."""
+        rows, _ = await self.query_database_page(
+            database_id, filter, sorts, page_size, start_cursor
+        )
+        return rows
+
+    @single_flight
+    async def query_database_page(
+        self,
+        database_id: str,
+        filter: Optional[dict] = None,
+        sorts: Optional[list[dict]] = None,
+        page_size: int = 100,
+        start_cursor: Optional[str] = None,
+    ) -> tuple[list[DatabaseRow], Optional[str]]:
+        """Query one page of database rows.
+
+        Returns:
+            The rows and the cursor for the next page (None on the last page)
+        """
+        params = self._query_params(database_id, filter, sorts, page_size)
+        if start_cursor:
+            params["start_cursor"] = start_cursor
+
+        results, cursor = await self._execute_list("NOTION_QUERY_DATABASE", params)
+        parse = self._parse_database_row
+        return [parse(r) for r in results], cursor
+
+    async def iter_database_rows(
+        self,
+        database_id: str,
+        filter: Optional[dict] = None,
+        sorts: Optional[list[dict]] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[DatabaseRow]:
+        """Yield every row matching a query, following Notion's cursor."""
+        params = self._query_params(database_id, filter, sorts, page_size)
+        async for r in self._iter_cursor("NOTION_QUERY_DATABASE", params):
+            yield self._parse_database_row(r)
+
+    def _query_params(
+        self,
+        database_id: str,
+        filter: Optional[dict],
+        sorts: Optional[list[dict]],
+        page_size: int,
+    ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "database_id": database_id,
             "page_size": page_size,
@@ -261,13 +438,9 @@ class NotionClient(_BaseClient):
             params["filter"] = filter
         if sorts:
             params["sorts"] = sorts
-        if start_cursor:
-            params["start_cursor"] = start_cursor
-
-        data = await self._execute("NOTION_QUERY_DATABASE", params)
-        results = data if isinstance(data, list) else data.get("results", [data])
-        return [self._parse_database_row(r) for r in results if isinstance(r, dict)]
+        return params
 
+    @invalidates
     async def create_database_row(self, database_id: str, properties: dict) -> DatabaseRow:
         """Insert a new row into a database."""
         data = await self._execute("NOTION_INSERT_ROW_DATABASE", {
@@ -276,13 +449,15 @@ class NotionClient(_BaseClient):
         })
         return self._parse_database_row(data)
 
+    @cached
     async def get_database_row(self, row_id: str) -> DatabaseRow:
         """Get a database row by ID."""
         data = await self._execute("NOTION_FETCH_ROW", {
             "row_id": row_id,
-        })
+        }, idempotent=True)
         return self._parse_database_row(data)
 
+    @invalidates
     async def update_database_row(
         self,
         row_id: str,
@@ -290,15 +465,16 @@ class NotionClient(_BaseClient):
         archived: Optional[bool] = None,
     ) -> DatabaseRow:
         """Update a database row."""
-        params: dict[str, Any] = {"row_id": row_id}
-        if properties is not None:
-            params["properties"] = properties
-        if archived is not None:
-            params["archived"] = archived
+        updates = (("properties", properties), ("archived", archived))
+        params: dict[str, Any] = {
+            "row_id": row_id,
+            **{k: v for k, v in updates if v is not None},
+        }
 
         data = await self._execute("NOTION_UPDATE_ROW_DATABASE", params)
         return self._parse_database_row(data)
 
+    @invalidates
     async def update_database_schema(
         self,
         database_id: str,
@@ -307,51 +483,44 @@ class NotionClient(_BaseClient):
         properties: Optional[dict] = None,
     ) -> Database:
         """Update database title, description, or properties."""
-        params: dict[str, Any] = {"database_id": database_id}
-        if title is not None:
-            params["title"] = title
-        if description is not None:
-            params["description"] = description
-        if properties is not None:
-            params["properties"] = properties
+        updates = (("title", title), ("description", description), ("properties", properties))
+        params: dict[str, Any] = {
+            "database_id": database_id,
+            **{k: v for k, v in updates if v is not None},
+        }
 
         data = await self._execute("NOTION_UPDATE_SCHEMA_DATABASE", params)
         return self._parse_database(data)
 
+    @cached
     async def get_database_property(self, database_id: str, property_id: str) -> dict:
         """Get a specific database property schema."""
         return await self._execute("NOTION_RETRIEVE_DATABASE_PROPERTY", {
             "database_id": database_id,
             "property_id": property_id,
-        })
+        }, idempotent=True)
 
     def _parse_database(self, data: dict) -> Database:
         """Parse raw API response into a Database model."""
-        title = None
-        title_arr = data.get("title", [])
-        if isinstance(title_arr, list) and title_arr:
-            title = "".join(t.get("plain_text", "") for t in title_arr)
-
-        desc = None
-        desc_arr = data.get("description", [])
-        if isinstance(desc_arr, list) and desc_arr:
-            desc = "".join(t.get("plain_text", "") for t in desc_arr)
+        title = _join_plain(data.get("title"))
+        desc = _join_plain(data.get("description"))
 
-        parent = data.get("parent", {})
+        parent = data.get("parent") or _EMPTY
         parent_type = parent.get("type")
         parent_id = parent.get(parent_type) if parent_type else None
+        icon = data.get("icon")
 
         return Database(
             id=data.get("id", ""),
             title=title,
             description=desc,
             url=data.get("url"),
-            icon=data.get("icon", {}).get("emoji") if isinstance(data.get("icon"), dict) else None,
+            icon=icon.get("emoji") if isinstance(icon, dict) else None,
             parent_id=parent_id,
             archived=data.get("archived", False),
             created_time=data.get("created_time"),
             last_edited_time=data.get("last_edited_time"),
-            properties=data.get("properties", {}),
+            properties=data.get("properties") or _EMPTY,
         )
 
     def _parse_database_row(self, data: dict) -> DatabaseRow:
@@ -359,7 +528,7 @@ class NotionClient(_BaseClient):
         return DatabaseRow(
             id=data.get("id", ""),
             url=data.get("url"),
-            properties=data.get("properties", {}),
+            properties=data.get("properties") or _EMPTY,
             created_time=data.get("created_time"),
             last_edited_time=data.get("last_edited_time"),
             archived=data.get("archived", False),
@@ -367,6 +536,7 @@ class NotionClient(_BaseClient):
 
     # ============== COMMENTS ==============
 
+    @invalidates
     async def create_comment(
         self,
         parent_id: str,
@@ -383,19 +553,21 @@ class NotionClient(_BaseClient):
         data = await self._execute("NOTION_CREATE_COMMENT", params)
         return self._parse_comment(data)
 
+    @single_flight
     async def get_comments(self, block_id: str) -> list[Comment]:
         """Get comments on a block or page."""
-        data = await self._execute("NOTION_FETCH_COMMENTS", {
+        results, _ = await self._execute_list("NOTION_FETCH_COMMENTS", {
             "block_id": block_id,
         })
-        results = data if isinstance(data, list) else data.get("results", [data])
-        return [self._parse_comment(c) for c in results if isinstance(c, dict)]
+        parse = self._parse_comment
+        return [parse(c) for c in results]
 
+    @cached
     async def get_comment(self, comment_id: str) -> Comment:
         """Get a specific comment by ID."""
         data = await self._execute("NOTION_RETRIEVE_COMMENT", {
             "comment_id": comment_id,
-        })
+        }, idempotent=True)
         return self._parse_comment(data)
 
     def _parse_comment(self, data: dict) -> Comment:
@@ -403,7 +575,7 @@ class NotionClient(_BaseClient):
         return Comment(
             id=data.get("id", ""),
             discussion_id=data.get("discussion_id"),
-            parent_id=data.get("parent", {}).get("page_id"),
+            parent_id=(data.get("parent") or _EMPTY).get("page_id"),
             rich_text=data.get("rich_text"),
             created_time=data.get("created_time"),
             created_by=data.get("created_by"),
@@ -411,36 +583,41 @@ class NotionClient(_BaseClient):
 
     # ============== USERS ==============
 
+    @cached
     async def get_current_user(self) -> User:
         """Get the bot user for this integration."""
-        data = await self._execute("NOTION_GET_ABOUT_ME", {})
+        data = await self._execute("NOTION_GET_ABOUT_ME", {}, idempotent=True)
         return self._parse_user(data)
 
+    @cached
     async def get_user(self, user_id: str) -> User:
         """Get a user by ID."""
         data = await self._execute("NOTION_GET_ABOUT_USER", {
             "user_id": user_id,
-        })
+        }, idempotent=True)
         return self._parse_user(data)
 
+    @cached
     async def list_users(self) -> list[User]:
         """List all users in the workspace."""
-        data = await self._execute("NOTION_LIST_USERS", {})
-        results = data if isinstance(data, list) else data.get("results", [data])
-        return [self._parse_user(u) for u in results if isinstance(u, dict)]
+        results, _ = await self._execute_list("NOTION_LIST_USERS", {})
+        parse = self._parse_user
+        return [parse(u) for u in results]
 
     def _parse_user(self, data: dict) -> User:
         """Parse raw API response into a User model."""
+        person = data.get("person")
         return User(
             id=data.get("id", ""),
             type=data.get("type"),
             name=data.get("name"),
             avatar_url=data.get("avatar_url"),
-            email=data.get("person", {}).get("email") if isinstance(data.get("person"), dict) else None,
+            email=person.get("email") if isinstance(person, dict) else None,
         )
 
     # ============== WORKSPACE ==============
 
+    @single_flight
     async def search_workspace(
         self,
         query: str = "",
@@ -459,12 +636,15 @@ class NotionClient(_BaseClient):
         else:
             params["get_all"] = True
 
-        data = await self._execute("NOTION_FETCH_DATA", params)
+        data = await self._execute("NOTION_FETCH_DATA", params, idempotent=True)
         if isinstance(data, list):
             results = data
         else:
-            results = data.get("results", data.get("values", []))
-        return [self._parse_search_result(r) for r in results if isinstance(r, dict)]
+            results = data.get("results")
+            if results is None:
+                results = data.get("values") or ()
+        parse = self._parse_search_result
+        return [parse(r) for r in results if isinstance(r, dict)]
 
     def _parse_search_result(self, data: dict) -> SearchResult:
         """Parse raw API response into a SearchResult model."""
@@ -472,18 +652,14 @@ class NotionClient(_BaseClient):
         title = None
 
         if obj_type == "database":
-            title_arr = data.get("title", [])
-            if isinstance(title_arr, list) and title_arr:
-                title = "".join(t.get("plain_text", "") for t in title_arr)
+            title = _join_plain(data.get("title"))
         else:
-            for prop in data.get("properties", {}).values():
+            for prop in (data.get("properties") or _EMPTY).values():
                 if isinstance(prop, dict) and prop.get("type") == "title":
-                    title_arr = prop.get("title", [])
-                    if isinstance(title_arr, list) and title_arr:
-                        title = "".join(t.get("plain_text", "") for t in title_arr)
+                    title = _join_plain(prop.get("title"))
                     break
 
-        parent = data.get("parent", {})
+        parent = data.get("parent") or _EMPTY
         parent_type = parent.get("type")
         parent_id = parent.get(parent_type) if parent_type else None
 
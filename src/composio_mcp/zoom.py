@@ -11,8 +11,13 @@ Usage:
         ))
 """
 
-from typing import Optional
+import asyncio
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Optional
 
+from pydantic import TypeAdapter
+
+from ._cache import cached, invalidates, single_flight
 from .client import _BaseClient
 from .models.zoom import (
     Meeting,
@@ -24,16 +29,25 @@ from .models.zoom import (
     Registrant,
 )
 
+# Lists whose items map onto the model fields directly are validated in
+# one pydantic-core call rather than per-item constructors
+_PARTICIPANT_LIST_ADAPTER = TypeAdapter(list[Participant])
+_RECORDING_FILE_LIST_ADAPTER = TypeAdapter(list[RecordingFile])
+
 
 class ZoomClient(_BaseClient):
     """Zoom client using Composio as the OAuth/API layer."""
 
+    # Zoom's per-second limit for light API calls
+    RATE_LIMIT = 10.0
+
     @classmethod
-    def from_env(cls) -> "ZoomClient":
-        return cls._from_env("zoom_connected_account_id", "ZOOM_CONNECTED_ACCOUNT_ID")
+    def from_env(cls, **kwargs: Any) -> "ZoomClient":
+        return cls._from_env("zoom_connected_account_id", "ZOOM_CONNECTED_ACCOUNT_ID", **kwargs)
 
     # ============== MEETINGS ==============
 
+    @single_flight
     async def list_meetings(self, meeting_type: str = "upcoming") -> list[Meeting]:
         """List meetings.
 
@@ -43,7 +57,7 @@ class ZoomClient(_BaseClient):
         data = await self._execute("ZOOM_LIST_MEETINGS", {
             "userId": "me",
             "type": meeting_type,
-        })
+        }, idempotent=True)
 
         return [
             Meeting(
@@ -54,7 +68,7 @@ class ZoomClient(_BaseClient):
                 timezone=m.get("timezone", "UTC"),
                 join_url=m.get("join_url"),
             )
-            for m in data.get("meetings", [])
+            for m in data.get("meetings") or ()
         ]
 
     async def create_meeting(self, meeting: MeetingCreate) -> Meeting:
@@ -91,9 +105,12 @@ class ZoomClient(_BaseClient):
             host_email=data.get("host_email"),
         )
 
+    @cached
     async def get_meeting(self, meeting_id: int) -> Meeting:
         """Get meeting details."""
-        data = await self._execute("ZOOM_GET_A_MEETING", {"meetingId": meeting_id})
+        data = await self._execute(
+            "ZOOM_GET_A_MEETING", {"meetingId": meeting_id}, idempotent=True
+        )
 
         return Meeting(
             id=data["id"],
@@ -108,6 +125,11 @@ class ZoomClient(_BaseClient):
             status=data.get("status"),
         )
 
+    async def get_meetings(self, meeting_ids: list[int]) -> list[Meeting]:
+        """Get details for several meetings concurrently, in the order given."""
+        return await self._gather(self.get_meeting(m) for m in meeting_ids)
+
+    @invalidates
     async def update_meeting(
         self,
         meeting_id: int,
@@ -117,18 +139,17 @@ class ZoomClient(_BaseClient):
         agenda: Optional[str] = None,
     ) -> None:
         """Update a meeting."""
-        params = {"meetingId": meeting_id, "type": 2}
-        if topic:
-            params["topic"] = topic
-        if start_time:
-            params["start_time"] = start_time
-        if duration:
-            params["duration"] = duration
-        if agenda:
-            params["agenda"] = agenda
+        updates = (
+            ("topic", topic),
+            ("start_time", start_time),
+            ("duration", duration),
+            ("agenda", agenda),
+        )
+        params = {"meetingId": meeting_id, "type": 2, **{k: v for k, v in updates if v}}
 
         await self._execute("ZOOM_UPDATE_A_MEETING", params)
 
+    @invalidates
     async def delete_meeting(self, meeting_id: int) -> None:
         """Delete a meeting.
 
@@ -161,34 +182,111 @@ class ZoomClient(_BaseClient):
 
     # ============== RECORDINGS ==============
 
+    @single_flight
     async def list_recordings(
         self,
         from_date: str,
         to_date: Optional[str] = None,
     ) -> list[Recording]:
-        """List cloud recordings in date range."""
-        params = {"userId": "me", "from": from_date}
-        if to_date:
-            params["to"] = to_date
+        """List cloud recordings in date range.
 
-        data = await self._execute("ZOOM_LIST_ALL_RECORDINGS", params)
+        Ranges longer than 30 days are listed window by window, oldest
+        first (see iter_recording_pages), so the list is in ascending window
+        order rather than the order of a single Zoom request.
+        """
+        recordings = []
+        async for page in self.iter_recording_pages(from_date, to_date):
+            recordings.extend(page)
+        return recordings
 
-        return [
-            Recording(
-                meeting_id=m["id"],
-                topic=m["topic"],
-                start_time=m["start_time"],
-                duration=m.get("duration", 0),
-                files=[],
-            )
-            for m in data.get("meetings", [])
+    async def iter_recording_pages(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> AsyncIterator[list[Recording]]:
+        """Yield cloud recordings in date range, one page at a time.
+
+        Zoom serves at most a month of recordings per request, so longer
+        ISO date ranges are split into 30-day windows. Up to ``concurrency``
+        windows are fetched at once and pages are yielded oldest window
+        first, letting callers print early windows while later ones are in
+        flight. Without to_date the last window is left open-ended, as Zoom
+        would treat a single request.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_window(start: str, end: Optional[str]) -> list[Recording]:
+            params = {"userId": "me", "from": start}
+            if end:
+                params["to"] = end
+            recordings = []
+            async with semaphore:
+                while True:
+                    data = await self._execute(
+                        "ZOOM_LIST_ALL_RECORDINGS", params, idempotent=True
+                    )
+                    recordings.extend(
+                        Recording(
+                            meeting_id=m["id"],
+                            topic=m["topic"],
+                            start_time=m["start_time"],
+                            duration=m.get("duration", 0),
+                            files=[],
+                        )
+                        for m in data.get("meetings") or ()
+                    )
+                    token = data.get("next_page_token")
+                    if not token:
+                        return recordings
+                    params = {**params, "next_page_token": token}
+
+        tasks = [
+            asyncio.ensure_future(fetch_window(start, end))
+            for start, end in self._recording_windows(from_date, to_date)
         ]
-
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Retrieve the cancelled windows' outcomes so none is left
+            # unobserved
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _recording_windows(
+        from_date: str, to_date: Optional[str]
+    ) -> list[tuple[str, Optional[str]]]:
+        """Split an ISO date range into inclusive 30-day windows.
+
+        An omitted to_date splits up to today, but the last window keeps no
+        end date so Zoom applies its own default.
+        """
+        try:
+            start = date.fromisoformat(from_date)
+            end = date.fromisoformat(to_date) if to_date else date.today()
+        except ValueError:
+            # Not plain ISO dates; let Zoom interpret the range as given
+            return [(from_date, to_date)]
+        if (end - start).days < 30:
+            return [(from_date, to_date)]
+        windows = []
+        while start <= end:
+            stop = min(start + timedelta(days=29), end)
+            windows.append((start.isoformat(), stop.isoformat()))
+            start = stop + timedelta(days=1)
+        if not to_date:
+            windows[-1] = (windows[-1][0], None)
+        return windows
+
+    @cached
     async def get_recording(self, meeting_id: int) -> Recording:
         """Get recording details for a meeting."""
         data = await self._execute("ZOOM_GET_MEETING_RECORDINGS", {
             "meetingId": meeting_id,
-        })
+        }, idempotent=True)
 
         return Recording(
             meeting_id=data["id"],
@@ -197,43 +295,26 @@ class ZoomClient(_BaseClient):
             duration=data.get("duration", 0),
             share_url=data.get("share_url"),
             password=data.get("password"),
-            files=[
-                RecordingFile(
-                    id=f["id"],
-                    file_type=f["file_type"],
-                    file_size=f.get("file_size", 0),
-                    download_url=f.get("download_url"),
-                    play_url=f.get("play_url"),
-                    status=f.get("status"),
-                )
-                for f in data.get("recording_files", [])
-            ],
+            files=_RECORDING_FILE_LIST_ADAPTER.validate_python(data.get("recording_files") or ()),
         )
 
     # ============== POST-MEETING ==============
 
+    @single_flight
     async def get_participants(self, meeting_id: int) -> list[Participant]:
         """Get participants from a past meeting."""
         data = await self._execute("ZOOM_GET_PAST_MEETING_PARTICIPANTS", {
             "meetingId": meeting_id,
-        })
+        }, idempotent=True)
 
-        return [
-            Participant(
-                name=p.get("name"),
-                email=p.get("user_email"),
-                join_time=p.get("join_time"),
-                leave_time=p.get("leave_time"),
-                duration=p.get("duration"),
-            )
-            for p in data.get("participants", [])
-        ]
+        return _PARTICIPANT_LIST_ADAPTER.validate_python(data.get("participants") or ())
 
+    @single_flight
     async def get_meeting_summary(self, meeting_id: int) -> MeetingSummary:
         """Get AI-generated meeting summary."""
         data = await self._execute("ZOOM_GET_A_MEETING_SUMMARY", {
             "meetingId": meeting_id,
-        })
+        }, idempotent=True)
 
         return MeetingSummary(
             meeting_id=meeting_id,
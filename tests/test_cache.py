@@ -0,0 +1,217 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from composio_mcp import _cache
+from composio_mcp._cache import _MISSING, TTLCache, cached, invalidates, single_flight
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(_cache.time, "monotonic", clock)
+    return clock
+
+
+class Parent:
+    def __init__(self, parent_id):
+        self.parent_id = parent_id
+
+
+class Client:
+    """Minimal client exposing the ``_cache`` the decorators expect."""
+
+    def __init__(self, ttl: float = 30.0):
+        self._cache = TTLCache(ttl=ttl)
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error: Optional[Exception] = None
+
+    @cached
+    async def get(self, item_id: str) -> list[str]:
+        self.calls += 1
+        await self.release.wait()
+        return [item_id, str(self.calls)]
+
+    @cached
+    async def get_property(self, item_id: str) -> dict:
+        self.calls += 1
+        return {"id": item_id, "values": [1]}
+
+    @single_flight
+    async def search(self, query: str) -> list[str]:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return [query]
+
+    @invalidates
+    async def update(self, item_id: str, parent_id: Optional[str] = None) -> Parent:
+        if self.error is not None:
+            raise self.error
+        return Parent(parent_id)
+
+
+# ============== TTLCache ==============
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("k", "v")
+    clock.now += 9.9
+    assert cache.get("k") == "v"
+    clock.now += 0.1
+    assert cache.get("k") is _MISSING
+
+
+def test_zero_ttl_disables_caching():
+    cache = TTLCache(ttl=0)
+    cache.set("k", "v")
+    assert cache.get("k") is _MISSING
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is _MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_invalidate_drops_entries_mentioning_value():
+    cache = TTLCache()
+    cache.set(("get", ("p1",), ()), 1)
+    cache.set(("get", ("p2",), ()), 2)
+    cache.invalidate("p1")
+    assert cache.get(("get", ("p1",), ())) is _MISSING
+    assert cache.get(("get", ("p2",), ())) == 2
+    cache.invalidate()
+    assert cache.get(("get", ("p2",), ())) is _MISSING
+
+
+# ============== @cached ==============
+
+
+async def test_cached_serves_repeat_calls():
+    client = Client()
+    assert await client.get("p1") == ["p1", "1"]
+    assert await client.get("p1") == ["p1", "1"]
+    assert client.calls == 1
+
+
+async def test_cached_refetches_after_ttl(clock):
+    client = Client(ttl=5)
+    await client.get("p1")
+    clock.now += 5
+    assert await client.get("p1") == ["p1", "2"]
+
+
+async def test_cached_returns_copies_of_lists():
+    client = Client()
+    (await client.get("p1")).clear()
+    assert await client.get("p1") == ["p1", "1"]
+
+
+async def test_cached_returns_deep_copies_of_dicts():
+    client = Client()
+    (await client.get_property("p1"))["values"].append(2)
+    assert await client.get_property("p1") == {"id": "p1", "values": [1]}
+    assert client.calls == 1
+
+
+async def test_invalidation_during_fetch_discards_result():
+    client = Client()
+    client.release.clear()
+    fetch = asyncio.ensure_future(client.get("p1"))
+    await asyncio.sleep(0)
+    client._cache.invalidate("p1")
+    client.release.set()
+    # The in-flight caller still gets its result...
+    assert await fetch == ["p1", "1"]
+    # ...but it isn't stored, since it may predate the mutation
+    assert await client.get("p1") == ["p1", "2"]
+
+
+# ============== @single_flight ==============
+
+
+async def test_single_flight_shares_concurrent_calls():
+    client = Client()
+    client.release.clear()
+    calls = [asyncio.ensure_future(client.search("q")) for _ in range(3)]
+    await asyncio.sleep(0)
+    client.release.set()
+    assert await asyncio.gather(*calls) == [["q"]] * 3
+    assert client.calls == 1
+    # Completed results aren't reused
+    await client.search("q")
+    assert client.calls == 2
+
+
+async def test_single_flight_error_reaches_every_caller_and_is_not_kept():
+    client = Client()
+    client.release.clear()
+    client.error = RuntimeError("boom")
+    calls = [asyncio.ensure_future(client.search("q")) for _ in range(2)]
+    await asyncio.sleep(0)
+    client.release.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+    client.error = None
+    assert await client.search("q") == ["q"]
+    assert client.calls == 2
+
+
+async def test_single_flight_survives_a_cancelled_caller():
+    client = Client()
+    client.release.clear()
+    first = asyncio.ensure_future(client.search("q"))
+    second = asyncio.ensure_future(client.search("q"))
+    await asyncio.sleep(0)
+    first.cancel()
+    client.release.set()
+    assert await second == ["q"]
+
+
+# ============== @invalidates ==============
+
+
+async def test_invalidates_drops_resource_and_parent():
+    client = Client()
+    await client.get("b1")
+    await client.get("p1")
+    await client.get("other")
+    await client.update("b1", parent_id="p1")
+    assert client._cache.get(("get", ("b1",), ())) is _MISSING
+    assert client._cache.get(("get", ("p1",), ())) is _MISSING
+    assert client._cache.get(("get", ("other",), ())) is not _MISSING
+
+
+async def test_invalidates_runs_when_mutation_fails():
+    client = Client()
+    await client.get("b1")
+    client.error = RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        await client.update("b1")
+    assert client._cache.get(("get", ("b1",), ())) is _MISSING
+
+
+async def test_invalidates_keeps_the_error_for_a_missing_id_argument():
+    client = Client()
+    with pytest.raises(TypeError):
+        await client.update()
@@ -0,0 +1,36 @@
+import httpx
+import pytest
+
+from composio_mcp.client import ComposioClient
+
+
+def client(body: dict) -> ComposioClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=body)
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ComposioClient("key", http_client=http)
+
+
+async def test_initiate_connection_reads_alternate_keys():
+    mgmt = client({"connectedAccountId": "ca_1", "redirectUrl": "https://auth"})
+    request = await mgmt.initiate_connection("ac_1")
+    assert request.id == "ca_1"
+    assert request.status == "INITIATED"
+    assert request.redirect_url == "https://auth"
+
+
+async def test_initiate_connection_without_id_fails():
+    with pytest.raises(ValueError):
+        await client({"redirect_url": "https://auth"}).initiate_connection("ac_1")
+
+
+async def test_link_token_is_not_taken_as_connection_id():
+    mgmt = client({"link_token": "lt_1", "redirect_url": "https://link"})
+    request = await mgmt.initiate_connection_link("ac_1")
+    assert request.id is None
+    assert request.link_token == "lt_1"
+
+    mgmt = client({"link_token": "lt_1", "connected_account_id": "ca_1"})
+    request = await mgmt.initiate_connection_link("ac_1")
+    assert (request.id, request.link_token) == ("ca_1", "lt_1")
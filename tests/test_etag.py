@@ -0,0 +1,70 @@
+import httpx
+
+from composio_mcp.client import ComposioClient
+
+
+def etagged(body: dict, etag: str = '"v1"'):
+    """MockTransport handler serving body with an ETag, and 304 when it matches."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    return handler, requests
+
+
+def client(handler) -> ComposioClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ComposioClient("key", http_client=http)
+
+
+async def test_repeat_get_revalidates_with_etag():
+    handler, requests = etagged({"id": "ac_1", "name": "Notion"})
+    mgmt = client(handler)
+    assert await mgmt._request("GET", "/auth_configs/ac_1") == {"id": "ac_1", "name": "Notion"}
+    assert await mgmt._request("GET", "/auth_configs/ac_1") == {"id": "ac_1", "name": "Notion"}
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_304_result_is_not_shared_with_earlier_callers():
+    handler, _ = etagged({"id": "ac_1", "expected_input_fields": [{"name": "a"}]})
+    mgmt = client(handler)
+    first = await mgmt.get_auth_config("ac_1")
+    first.expected_input_fields.append({"name": "changed"})
+    raw = await mgmt._request("GET", "/auth_configs/ac_1")
+    raw["id"] = "changed"
+    second = await mgmt.get_auth_config("ac_1")
+    assert second.id == "ac_1"
+    assert second.expected_input_fields == [{"name": "a"}]
+
+
+async def test_changed_resource_replaces_stored_body():
+    state = {"etag": '"v1"', "body": {"id": "ac_1", "name": "Old"}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == state["etag"]:
+            return httpx.Response(304)
+        return httpx.Response(200, json=state["body"], headers={"ETag": state["etag"]})
+
+    mgmt = client(handler)
+    await mgmt.get_auth_config("ac_1")
+    state.update(etag='"v2"', body={"id": "ac_1", "name": "New"})
+    assert (await mgmt.get_auth_config("ac_1")).name == "New"
+    assert (await mgmt.get_auth_config("ac_1")).name == "New"
+
+
+async def test_responses_without_etag_are_not_stored():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"id": "ac_1"})
+
+    mgmt = client(handler)
+    await mgmt.get_auth_config("ac_1")
+    await mgmt.get_auth_config("ac_1")
+    assert all("If-None-Match" not in r.headers for r in requests)
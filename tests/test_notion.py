@@ -0,0 +1,129 @@
+import httpx
+import pytest
+
+from composio_mcp import _json
+from composio_mcp.notion import BlockAppendError, NotionClient
+
+
+def actions(handle):
+    """MockTransport handler passing each action's input to handle(input).
+
+    handle returns the action's data, or an httpx.Response to send as is.
+    The inputs are recorded in order.
+    """
+    inputs: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = _json.loads(request.content)["input"]
+        inputs.append(body)
+        data = handle(body)
+        if isinstance(data, httpx.Response):
+            return data
+        return httpx.Response(200, json={"successful": True, "data": data})
+
+    return handler, inputs
+
+
+def client(handler) -> NotionClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return NotionClient("key", "account", http_client=http, cache_ttl=0, rate_limit=0)
+
+
+def blocks(n: int) -> list[dict]:
+    return [{"type": "paragraph", "text": str(i)} for i in range(n)]
+
+
+def echo(body: dict) -> dict:
+    return {"object": "list", "results": [{"id": b["text"]} for b in body["children"]]}
+
+
+# ============== BATCHED APPENDS ==============
+
+
+async def test_small_append_is_one_request():
+    handler, inputs = actions(echo)
+    result = await client(handler).append_complex_blocks("p1", blocks(3))
+    assert len(inputs) == 1
+    assert result == {"object": "list", "results": [{"id": "0"}, {"id": "1"}, {"id": "2"}]}
+
+
+async def test_large_append_is_split_and_merged_in_order():
+    handler, inputs = actions(echo)
+    result = await client(handler).append_complex_blocks("p1", blocks(250))
+    assert [len(i["children"]) for i in inputs] == [100, 100, 50]
+    assert [r["id"] for r in result["results"]] == [str(i) for i in range(250)]
+
+
+async def test_responses_without_results_keep_the_same_shape():
+    handler, _ = actions(lambda body: {"status": "ok"})
+    result = await client(handler).add_content_blocks("p1", blocks(150))
+    assert result == {"status": "ok", "results": []}
+
+
+async def test_failed_chunk_reports_how_many_blocks_landed():
+    def handle(body):
+        if body["children"][0]["text"] == "200":
+            return httpx.Response(400)
+        return echo(body)
+
+    handler, inputs = actions(handle)
+    with pytest.raises(BlockAppendError) as info:
+        await client(handler).append_complex_blocks("p1", blocks(350))
+    assert info.value.appended == 200
+    assert len(info.value.result["results"]) == 200
+    assert isinstance(info.value.__cause__, httpx.HTTPStatusError)
+    # Nothing after the failing chunk was sent
+    assert len(inputs) == 3
+
+
+async def test_failed_first_chunk_raises_the_original_error():
+    handler, _ = actions(lambda body: httpx.Response(400))
+    with pytest.raises(httpx.HTTPStatusError):
+        await client(handler).append_complex_blocks("p1", blocks(150))
+
+
+# ============== CURSOR ITERATORS ==============
+
+
+def cursor_pages(pages: dict):
+    """Handle list actions from pages keyed by start_cursor ("" for the first)."""
+    def handle(body):
+        items, next_cursor = pages[body.get("start_cursor", "")]
+        return {"results": items, "next_cursor": next_cursor}
+
+    return handle
+
+
+async def test_iterator_follows_cursor_until_exhausted():
+    handler, inputs = actions(cursor_pages({
+        "": ([{"id": "b1", "type": "paragraph"}], "c2"),
+        "c2": ([{"id": "b2", "type": "paragraph"}, "not-a-block"], "c3"),
+        "c3": ([{"id": "b3", "type": "paragraph"}], None),
+    }))
+    blocks = [b async for b in client(handler).iter_block_children("p1", page_size=1)]
+    assert [b.id for b in blocks] == ["b1", "b2", "b3"]
+    assert [i.get("start_cursor") for i in inputs] == [None, "c2", "c3"]
+    assert all(i["block_id"] == "p1" and i["page_size"] == 1 for i in inputs)
+
+
+async def test_database_rows_keep_filter_and_sorts_across_pages():
+    handler, inputs = actions(cursor_pages({
+        "": ([{"id": "r1"}], "c2"),
+        "c2": ([{"id": "r2"}], None),
+    }))
+    f = {"property": "Done", "checkbox": {"equals": True}}
+    s = [{"property": "Name", "direction": "ascending"}]
+    rows = [r async for r in client(handler).iter_database_rows("db1", f, s)]
+    assert [r.id for r in rows] == ["r1", "r2"]
+    assert all(i["filter"] == f and i["sorts"] == s for i in inputs)
+
+
+async def test_closing_an_iterator_stops_fetching():
+    handler, inputs = actions(cursor_pages({
+        "": ([{"id": "r1"}, {"id": "r2"}], "c2"),
+        "c2": ([{"id": "r3"}], None),
+    }))
+    rows = client(handler).iter_database_rows("db1")
+    assert (await rows.__anext__()).id == "r1"
+    await rows.aclose()
+    assert len(inputs) == 1
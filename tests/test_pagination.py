@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+import pytest
+
+from composio_mcp.client import ComposioClient
+
+
+def paged(pages: dict, total_pages: int):
+    """MockTransport handler serving toolkit pages keyed by cursor ("" for the first)."""
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor", "")
+        requests.append(cursor)
+        page = pages[cursor]
+        if isinstance(page, httpx.Response):
+            return page
+        items, next_cursor = page
+        return httpx.Response(200, json={
+            "items": [{"slug": s} for s in items],
+            "next_cursor": next_cursor,
+            "total_pages": total_pages,
+        })
+
+    return handler, requests
+
+
+def client(handler) -> ComposioClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ComposioClient("key", http_client=http)
+
+
+async def test_page_number_cursors_fan_out_in_order():
+    handler, requests = paged({
+        "": (["a"], "2"),
+        "2": (["b"], "3"),
+        "3": (["c"], "4"),
+        "4": (["d"], None),
+    }, total_pages=4)
+    toolkits = await client(handler).list_toolkits()
+    assert [t.slug for t in toolkits] == ["a", "b", "c", "d"]
+    assert sorted(requests) == ["", "2", "3", "4"]
+
+
+async def test_offset_cursors_are_followed_one_at_a_time():
+    # An all-digit cursor that isn't a page number must not truncate the listing
+    handler, requests = paged({
+        "": (["a"], "20"),
+        "20": (["b"], "40"),
+        "40": (["c"], None),
+    }, total_pages=3)
+    toolkits = await client(handler).list_toolkits()
+    assert [t.slug for t in toolkits] == ["a", "b", "c"]
+    assert requests == ["", "20", "40"]
+
+
+async def test_opaque_cursors_are_followed():
+    handler, requests = paged({
+        "": (["a"], "abc"),
+        "abc": (["b"], None),
+    }, total_pages=2)
+    toolkits = await client(handler).list_toolkits()
+    assert [t.slug for t in toolkits] == ["a", "b"]
+
+
+async def test_failed_page_raises_and_leaves_no_pending_tasks():
+    handler, _ = paged({
+        "": (["a"], "2"),
+        "2": (["b"], "3"),
+        "3": httpx.Response(404),
+        "4": (["d"], "5"),
+        "5": (["e"], None),
+    }, total_pages=5)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client(handler).list_toolkits()
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert pending == []
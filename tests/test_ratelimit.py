@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from composio_mcp import _ratelimit
+from composio_mcp._ratelimit import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Virtual time: asyncio.sleep in the limiter advances the clock instantly."""
+    state = {"now": 0.0, "sleeps": []}
+
+    async def sleep(seconds: float) -> None:
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(_ratelimit.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(_ratelimit.asyncio, "sleep", sleep)
+    return state
+
+
+async def test_burst_goes_through_without_waiting(clock):
+    limiter = RateLimiter(3)
+    for _ in range(3):
+        await limiter.acquire()
+    assert clock["sleeps"] == []
+
+
+async def test_calls_beyond_burst_are_paced_to_rate(clock):
+    limiter = RateLimiter(4, burst=1)
+    for _ in range(5):
+        await limiter.acquire()
+    assert clock["now"] == pytest.approx(1.0)
+    assert clock["sleeps"] == pytest.approx([0.25] * 4)
+
+
+async def test_tokens_refill_while_idle(clock):
+    limiter = RateLimiter(2, burst=2)
+    await limiter.acquire()
+    await limiter.acquire()
+    clock["now"] += 1.0
+    await limiter.acquire()
+    await limiter.acquire()
+    assert clock["sleeps"] == []
+
+
+async def test_concurrent_waiters_are_spaced_out():
+    limiter = RateLimiter(50, burst=1)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def stamp() -> float:
+        async with limiter:
+            return loop.time() - start
+
+    times = sorted(await asyncio.gather(*(stamp() for _ in range(4))))
+    assert times[0] < 0.02
+    assert times[-1] >= 3 / 50 - 0.005
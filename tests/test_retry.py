@@ -0,0 +1,143 @@
+import httpx
+import pytest
+
+from composio_mcp import client as client_module
+from composio_mcp.client import ComposioClient, _BaseClient, _retry_delay
+from composio_mcp.notion import NotionClient
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(client_module, "_retry_delay", lambda response, attempt: 0)
+
+
+def responder(*responses: httpx.Response):
+    """MockTransport handler replaying responses, then 200s; records each request."""
+    queue = list(responses)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if queue:
+            return queue.pop(0)
+        return httpx.Response(200, json={"successful": True, "data": {"ok": True}})
+
+    return handler, requests
+
+
+def base_client(handler) -> _BaseClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return _BaseClient("key", "account", http_client=http, cache_ttl=0, rate_limit=0)
+
+
+def management_client(handler) -> ComposioClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ComposioClient("key", http_client=http)
+
+
+# ============== IDEMPOTENT REQUESTS ==============
+
+
+@pytest.mark.parametrize("status", [429, 502, 503, 504])
+async def test_get_retries_transient_statuses(status):
+    handler, requests = responder(httpx.Response(status))
+    client = management_client(handler)
+    assert await client._request("GET", "/toolkits") == {"successful": True, "data": {"ok": True}}
+    assert len(requests) == 2
+
+
+async def test_get_gives_up_after_max_retries():
+    handler, requests = responder(*[httpx.Response(502)] * 10)
+    client = management_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._request("GET", "/toolkits")
+    assert len(requests) == client_module._MAX_RETRIES + 1
+
+
+async def test_client_errors_are_not_retried():
+    handler, requests = responder(httpx.Response(404))
+    client = management_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._request("GET", "/toolkits")
+    assert len(requests) == 1
+
+
+# ============== WRITES AND ACTIONS ==============
+
+
+@pytest.mark.parametrize("status", [502, 504])
+async def test_action_is_not_resent_on_gateway_error(status):
+    handler, requests = responder(httpx.Response(status))
+    client = base_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._execute("NOTION_CREATE_NOTION_PAGE", {})
+    assert len(requests) == 1
+
+
+async def test_action_is_not_resent_on_503_without_retry_after():
+    handler, requests = responder(httpx.Response(503))
+    client = base_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._execute("ZOOM_CREATE_A_MEETING", {})
+    assert len(requests) == 1
+
+
+@pytest.mark.parametrize("response", [
+    httpx.Response(429),
+    httpx.Response(503, headers={"Retry-After": "1"}),
+])
+async def test_action_retries_when_request_was_not_processed(response):
+    handler, requests = responder(response)
+    client = base_client(handler)
+    assert await client._execute("NOTION_CREATE_NOTION_PAGE", {}) == {"ok": True}
+    assert len(requests) == 2
+
+
+async def test_v3_write_is_not_resent_on_gateway_error():
+    handler, requests = responder(httpx.Response(502))
+    client = management_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._request("POST", "/connected_accounts", body={})
+    assert len(requests) == 1
+
+
+async def test_execute_action_is_not_resent_on_gateway_error():
+    handler, requests = responder(httpx.Response(504))
+    client = management_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.execute_action("NOTION_CREATE_COMMENT", "uuid-1234")
+    assert len(requests) == 1
+
+
+@pytest.mark.parametrize("status", [502, 504])
+async def test_notion_read_retries_gateway_error_but_create_does_not(status):
+    page = {"id": "p1", "parent": {"type": "page_id", "page_id": "root"}}
+    ok = {"successful": True, "data": page}
+
+    handler, requests = responder(httpx.Response(status), httpx.Response(200, json=ok))
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    notion = NotionClient("key", "account", http_client=http, cache_ttl=0, rate_limit=0)
+    assert (await notion.get_page("p1")).id == "p1"
+    assert len(requests) == 2
+
+    handler, requests = responder(httpx.Response(status))
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    notion = NotionClient("key", "account", http_client=http, cache_ttl=0, rate_limit=0)
+    with pytest.raises(httpx.HTTPStatusError):
+        await notion.create_page("root", "Title")
+    assert len(requests) == 1
+
+
+# ============== BACKOFF ==============
+
+
+def test_retry_delay_honours_retry_after():
+    assert _retry_delay(httpx.Response(429, headers={"Retry-After": "2"}), 0) == 2.0
+    assert _retry_delay(httpx.Response(429, headers={"Retry-After": "600"}), 0) == 30.0
+
+
+def test_retry_delay_backs_off_exponentially():
+    first = _retry_delay(httpx.Response(502), 0)
+    later = _retry_delay(httpx.Response(502), 5)
+    assert 0.5 <= first <= 1.0
+    assert 8.0 <= later <= 8.5
@@ -0,0 +1,115 @@
+import gc
+import json
+
+import httpx
+import pytest
+from pydantic import TypeAdapter
+
+import server
+from src.composio_mcp.models import Toolkit
+from src.composio_mcp.notion import NotionClient
+
+
+class Session:
+    """Stand-in for an MCP ServerSession (only its identity matters)."""
+
+
+class Ctx:
+    def __init__(self, session: Session):
+        self.session = session
+
+
+@pytest.fixture
+def notion(monkeypatch):
+    """Point the server's Notion client at a MockTransport; yields the query inputs."""
+    state = {"fail": False, "inputs": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["inputs"].append(json.loads(request.content)["input"])
+        if state["fail"]:
+            return httpx.Response(400)
+        data = {"results": [{"id": "r1"}], "next_cursor": "c2"}
+        return httpx.Response(200, json={"successful": True, "data": data})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    clients = server._Clients()
+    clients.notion = NotionClient("key", "account", http_client=http, cache_ttl=0, rate_limit=0)
+    monkeypatch.setattr(server, "clients", clients)
+    return state
+
+
+# ============== OPEN QUERIES ==============
+
+
+async def test_query_handle_is_fetched_by_its_own_session(notion):
+    ctx = Ctx(Session())
+    page = json.loads(await server.notion_open_query(ctx, "db1", page_size=10))
+    assert page["next_cursor"] == "c2"
+
+    more = json.loads(await server.notion_fetch_query_page(ctx, page["resource"], "c2"))
+    assert [r["id"] for r in more["results"]] == ["r1"]
+    assert notion["inputs"][-1] == {
+        "database_id": "db1", "page_size": 100, "start_cursor": "c2"
+    }
+
+
+async def test_other_sessions_cannot_use_a_handle(notion):
+    page = json.loads(await server.notion_open_query(Ctx(Session()), "db1"))
+    with pytest.raises(ValueError, match="Unknown or expired"):
+        await server.notion_fetch_query_page(Ctx(Session()), page["resource"], "c2")
+
+
+async def test_failed_open_registers_nothing(notion):
+    notion["fail"] = True
+    with pytest.raises(httpx.HTTPStatusError):
+        await server.notion_open_query(Ctx(Session()), "db1")
+    assert len(server.clients.queries) == 0
+
+
+async def test_closed_session_queries_are_dropped_and_not_inherited(notion):
+    session = Session()
+    page = json.loads(await server.notion_open_query(Ctx(session), "db1"))
+    assert page["resource"] in server.clients.queries
+
+    del session
+    gc.collect()
+    assert page["resource"] not in server.clients.queries
+    with pytest.raises(ValueError, match="Unknown or expired"):
+        await server.notion_fetch_query_page(Ctx(Session()), page["resource"], "c2")
+
+
+# ============== STREAMED LISTINGS ==============
+
+
+async def stream(items):
+    for item in items:
+        yield item
+
+
+TOOLKITS = [
+    Toolkit(slug="notion", name="Notion", categories=["docs"]),
+    Toolkit(slug="zoom", name="Zoom"),
+]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("items", [TOOLKITS, TOOLKITS[:1], []])
+async def test_streamed_output_matches_dumping_the_whole_list(monkeypatch, indent, items):
+    monkeypatch.setattr(server, "_INDENT", indent)
+    expected = TypeAdapter(list[Toolkit]).dump_json(items, indent=indent).decode()
+    assert await server._dumps_stream(stream(items)) == expected
+
+
+
+async def test_take_stops_the_underlying_listing():
+    closed = []
+
+    async def rows():
+        try:
+            for i in range(10):
+                yield i
+        finally:
+            closed.append(True)
+
+    assert [i async for i in server._take(rows(), 3)] == [0, 1, 2]
+    assert closed == [True]
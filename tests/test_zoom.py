@@ -0,0 +1,100 @@
+import asyncio
+from datetime import date, timedelta
+
+import httpx
+import pytest
+
+from composio_mcp import _json
+from composio_mcp.zoom import ZoomClient
+
+
+def recordings(handle):
+    """MockTransport handler answering ZOOM_LIST_ALL_RECORDINGS via handle(input)."""
+    inputs: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = _json.loads(request.content)["input"]
+        inputs.append(body)
+        data = handle(body)
+        if isinstance(data, httpx.Response):
+            return data
+        return httpx.Response(200, json={"successful": True, "data": data})
+
+    return handler, inputs
+
+
+def client(handler) -> ZoomClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ZoomClient("key", "account", http_client=http, cache_ttl=0, rate_limit=0)
+
+
+def meeting(meeting_id: int, day: str) -> dict:
+    return {"id": meeting_id, "topic": f"M{meeting_id}", "start_time": f"{day}T10:00:00Z"}
+
+
+# ============== WINDOWS ==============
+
+
+def test_short_range_is_one_window():
+    assert ZoomClient._recording_windows("2026-01-01", "2026-01-30") == [
+        ("2026-01-01", "2026-01-30")
+    ]
+
+
+def test_long_range_is_split_into_inclusive_30_day_windows():
+    assert ZoomClient._recording_windows("2026-01-01", "2026-03-15") == [
+        ("2026-01-01", "2026-01-30"),
+        ("2026-01-31", "2026-03-01"),
+        ("2026-03-02", "2026-03-15"),
+    ]
+
+
+def test_open_ended_range_leaves_last_window_without_end():
+    start = (date.today() - timedelta(days=45)).isoformat()
+    windows = ZoomClient._recording_windows(start, None)
+    assert len(windows) == 2
+    assert windows[0][0] == start and windows[0][1] is not None
+    assert windows[-1][1] is None
+
+
+def test_non_iso_dates_pass_through():
+    assert ZoomClient._recording_windows("last month", None) == [("last month", None)]
+
+
+# ============== LISTING ==============
+
+
+async def test_windows_are_listed_oldest_first_following_page_tokens():
+    def handle(body):
+        if body["from"] == "2026-01-01":
+            if body.get("next_page_token") == "t2":
+                return {"meetings": [meeting(2, "2026-01-20")]}
+            return {"meetings": [meeting(1, "2026-01-10")], "next_page_token": "t2"}
+        return {"meetings": [meeting(3, "2026-02-10")]}
+
+    handler, inputs = recordings(handle)
+    result = await client(handler).list_recordings("2026-01-01", "2026-02-15")
+    assert [r.meeting_id for r in result] == [1, 2, 3]
+    assert len(inputs) == 3
+
+
+async def test_omitted_to_date_is_not_sent():
+    handler, inputs = recordings(lambda body: {"meetings": []})
+    start = (date.today() - timedelta(days=45)).isoformat()
+    await client(handler).list_recordings(start)
+    latest = max(inputs, key=lambda i: i["from"])
+    assert "to" not in latest
+    assert all("to" in i for i in inputs if i is not latest)
+
+
+async def test_failed_window_raises_and_leaves_no_pending_tasks():
+    def handle(body):
+        if body["from"] == "2026-01-31":
+            return httpx.Response(400)
+        return {"meetings": []}
+
+    handler, _ = recordings(handle)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client(handler).list_recordings("2026-01-01", "2026-06-01")
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert pending == []